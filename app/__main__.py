@@ -0,0 +1,17 @@
+import os
+
+import uvicorn
+
+from app.core.settings import settings
+
+
+def main() -> None:
+    """Inicia a API com um worker por CPU (ou `WORKERS`, se definido)."""
+    workers = settings.WORKERS or os.cpu_count() or 1
+    # Os workers leem as configurações do ambiente; o pool é dividido entre eles
+    os.environ["WORKERS"] = str(workers)
+    uvicorn.run("app.main:app", host=settings.HOST, port=settings.PORT, workers=workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Athlete filter indexes
+
+Revision ID: 51a7ff615eb9
+Revises: c56c63840308
+Create Date: 2026-10-19 11:37:05.118402
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '51a7ff615eb9'
+down_revision: str | Sequence[str] | None = 'c56c63840308'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Índices para os formatos de filtro/ordenação mais comuns do AthleteFilter e para as FKs
+INDEXES = {
+    "ix_athletes_category_id": ["category_id"],
+    "ix_athletes_training_center_id": ["training_center_id"],
+    "ix_athletes_gender_age": ["gender", "age"],
+    "ix_athletes_name": ["name"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não bloqueia escritas, mas não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        for index_name, columns in INDEXES.items():
+            op.create_index(
+                index_name,
+                "athletes",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in reversed(list(INDEXES)):
+            op.drop_index(index_name, table_name="athletes", postgresql_concurrently=True, if_exists=True)
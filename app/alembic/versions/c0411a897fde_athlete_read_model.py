@@ -0,0 +1,90 @@
+"""Athlete read model
+
+Revision ID: c0411a897fde
+Revises: 51a7ff615eb9
+Create Date: 2026-10-19 15:48:12.301877
+
+Cria a projeção desnormalizada `athlete_read_model` usada pela listagem de
+atletas (ATHLETE_READ_MODEL_ENABLED) e a preenche a partir das tabelas
+normalizadas. Divergências podem ser verificadas com `make check-read-model`.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0411a897fde'
+down_revision: str | Sequence[str] | None = '51a7ff615eb9'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LIST_COLUMNS = [
+    "category_id", "category_name", "category_created_at",
+    "training_center_id", "training_center_name", "training_center_address",
+    "training_center_owner", "training_center_created_at",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "athlete_read_model",
+        sa.Column("athlete_pk_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("document_number", sa.String(length=11), nullable=False),
+        sa.Column("age", sa.Integer(), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.Column("height", sa.Float(), nullable=False),
+        sa.Column("gender", sa.String(length=1), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("category_pk_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("category_name", sa.String(length=20), nullable=False),
+        sa.Column("category_created_at", sa.DateTime(), nullable=False),
+        sa.Column("training_center_pk_id", sa.Integer(), nullable=False),
+        sa.Column("training_center_id", sa.UUID(), nullable=False),
+        sa.Column("training_center_name", sa.String(length=20), nullable=False),
+        sa.Column("training_center_address", sa.String(length=50), nullable=False),
+        sa.Column("training_center_owner", sa.String(length=50), nullable=False),
+        sa.Column("training_center_created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("athlete_pk_id"),
+    )
+    op.create_index(op.f("ix_athlete_read_model_id"), "athlete_read_model", ["id"], unique=True)
+    op.create_index("ix_athlete_read_model_name", "athlete_read_model", ["name"], postgresql_include=LIST_COLUMNS)
+    op.create_index(
+        "ix_athlete_read_model_training_center_pk_id",
+        "athlete_read_model",
+        ["training_center_pk_id", "athlete_pk_id"],
+    )
+    op.create_index("ix_athlete_read_model_gender_age", "athlete_read_model", ["gender", "age"])
+    op.create_index("ix_athlete_read_model_category_pk_id", "athlete_read_model", ["category_pk_id"])
+
+    # Backfill na mesma transação da criação: a tabela só fica visível já preenchida
+    op.execute("""
+        INSERT INTO athlete_read_model (
+            athlete_pk_id, id, name, document_number, age, weight, height, gender, created_at,
+            category_pk_id, category_id, category_name, category_created_at,
+            training_center_pk_id, training_center_id, training_center_name, training_center_address,
+            training_center_owner, training_center_created_at
+        )
+        SELECT
+            a.pk_id, a.id, a.name, a.document_number, a.age, a.weight, a.height, a.gender, a.created_at,
+            c.pk_id, c.id, c.name, c.created_at,
+            t.pk_id, t.id, t.name, t.address, t.owner, t.created_at
+        FROM athletes a
+        JOIN categories c ON c.pk_id = a.category_id
+        JOIN training_centers t ON t.pk_id = a.training_center_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_athlete_read_model_category_pk_id", table_name="athlete_read_model")
+    op.drop_index("ix_athlete_read_model_gender_age", table_name="athlete_read_model")
+    op.drop_index("ix_athlete_read_model_training_center_pk_id", table_name="athlete_read_model")
+    op.drop_index("ix_athlete_read_model_name", table_name="athlete_read_model")
+    op.drop_index(op.f("ix_athlete_read_model_id"), table_name="athlete_read_model")
+    op.drop_table("athlete_read_model")
@@ -0,0 +1,73 @@
+"""Unique UUIDv7 ids
+
+Revision ID: c56c63840308
+Revises: 84649119151e
+Create Date: 2026-10-19 09:12:41.503218
+
+"""
+from collections.abc import Sequence
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.contrib.models import uuid7
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c56c63840308'
+down_revision: str | Sequence[str] | None = '84649119151e'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("categories", "training_centers", "athletes")
+BATCH_SIZE = 1000
+
+
+def _backfill_duplicated_ids(table_name: str) -> None:
+    """
+    Gera um novo UUIDv7 para cada linha cujo id repete o de uma linha anterior.
+
+    A primeira linha de cada id mantém o valor atual (clientes podem já conhecê-lo).
+    Cada lote é gravado em sua própria transação para não segurar locks longos.
+    """
+    bind = op.get_bind()
+    table = sa.table(table_name, sa.column("pk_id", sa.Integer), sa.column("id", sa.UUID(as_uuid=True)))
+    ranked = sa.select(
+        table.c.pk_id,
+        sa.func.row_number().over(partition_by=table.c.id, order_by=table.c.pk_id).label("position"),
+    ).subquery()
+    duplicated_pk_ids = bind.execute(
+        sa.select(ranked.c.pk_id).where(ranked.c.position > 1).order_by(ranked.c.pk_id)
+    ).scalars().all()
+
+    update_statement = (
+        table.update()
+        .where(table.c.pk_id == sa.bindparam("b_pk_id"))
+        .values(id=sa.bindparam("b_id"))
+    )
+    for start in range(0, len(duplicated_pk_ids), BATCH_SIZE):
+        batch = duplicated_pk_ids[start:start + BATCH_SIZE]
+        bind.execute(update_statement, [{"b_pk_id": pk_id, "b_id": uuid7()} for pk_id in batch])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for table_name in TABLES:
+            # O backfill precisa ler as linhas existentes; no modo offline (--sql) só o índice é gerado
+            if not context.is_offline_mode():
+                _backfill_duplicated_ids(table_name)
+            op.create_index(
+                op.f(f"ix_{table_name}_id"),
+                table_name,
+                ["id"],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table_name in reversed(TABLES):
+            op.drop_index(op.f(f"ix_{table_name}_id"), table_name=table_name, postgresql_concurrently=True)
@@ -4,9 +4,9 @@ from app.core.databases import get_async_context_session
 from app.modules.athlete.repository import AthleteRepository
 from app.modules.category.repository import CategoryRepository
 from app.modules.training_center.repository import TrainingCenterRepository
-from app.modules.athlete import AthleteModel
-from app.modules.category import CategoryModel
-from app.modules.training_center import TrainingCenterModel
+from app.modules.athlete.models import AthleteModel
+from app.modules.category.models import CategoryModel
+from app.modules.training_center.models import TrainingCenterModel
 
 __all__ = [
     "AthleteModel",
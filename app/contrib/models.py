@@ -1,9 +1,30 @@
+import os
+import time
 import sqlalchemy as sa
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from uuid import UUID, uuid4
+from uuid import UUID
+
+__all__ = ["ModelBase", "uuid7"]
+
+
+def uuid7() -> UUID:
+    """
+    Gera um UUID versão 7 (RFC 9562).
+
+    Os 48 bits iniciais são o timestamp em milissegundos e os 12 seguintes, a
+    fração do milissegundo (método 3 da RFC), então ids gerados em sequência
+    ficam em ordem e próximos no índice, ao contrário do UUID4 aleatório.
+    """
+    timestamp_ms, fraction_ns = divmod(time.time_ns(), 1_000_000)
+    rand = int.from_bytes(os.urandom(8))
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= (fraction_ns * 4096 // 1_000_000) << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(int=value)
 
-__all__ = ["ModelBase"]
 
 class ModelBase(DeclarativeBase):
-    id: Mapped[UUID] = mapped_column(sa.UUID(as_uuid=True), default=uuid4(), nullable=False)
-    __abstract__ = True
\ No newline at end of file
+    id: Mapped[UUID] = mapped_column(sa.UUID(as_uuid=True), default=uuid7, nullable=False, unique=True, index=True)
+    __abstract__ = True
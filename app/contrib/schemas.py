@@ -1,9 +1,15 @@
+from collections.abc import Sequence
+from typing import Any, Generic, TypeVar
 from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 from datetime import datetime
 
+from app.core.settings import settings
 
-__all__ = ["SchemaBase", "SchemaBaseOutput"]
+
+__all__ = ["SchemaBase", "SchemaBaseOutput", "BatchGetInput", "BatchGetItem", "BatchGetOutput", "build_batch_get_output"]
+
+T = TypeVar("T")
 
 
 class SchemaBase(BaseModel):
@@ -12,4 +18,33 @@ class SchemaBase(BaseModel):
 
 class SchemaBaseOutput(SchemaBase):
     id: UUID = Field(title="ID", description="ID do registro")
-    created_at: datetime = Field(title="Data de criação", description="Data de criação do registro")
\ No newline at end of file
+    created_at: datetime = Field(title="Data de criação", description="Data de criação do registro")
+
+
+class BatchGetInput(SchemaBase):
+    ids: list[UUID] = Field(
+        title="IDs",
+        description="IDs dos registros a serem buscados",
+        min_length=1,
+        max_length=settings.BATCH_GET_MAX_IDS,
+    )
+
+
+class BatchGetItem(SchemaBase, Generic[T]):
+    id: UUID = Field(title="ID", description="ID solicitado")
+    found: bool = Field(title="Encontrado", description="Indica se o registro foi encontrado")
+    item: T | None = Field(default=None, title="Registro", description="Registro encontrado")
+
+
+class BatchGetOutput(SchemaBase, Generic[T]):
+    items: list[BatchGetItem[T]]
+
+
+def build_batch_get_output(ids: Sequence[UUID], db_objs: Sequence[Any | None]) -> dict[str, Any]:
+    """Monta a resposta do batch-get na ordem dos IDs recebidos."""
+    return {
+        "items": [
+            {"id": id, "found": db_obj is not None, "item": db_obj}
+            for id, db_obj in zip(ids, db_objs)
+        ]
+    }
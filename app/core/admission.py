@@ -0,0 +1,144 @@
+import asyncio
+import heapq
+import itertools
+from collections.abc import Iterable
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+__all__ = ["AdmissionLimiter", "AdmissionControlMiddleware"]
+
+# Prioridades: quanto menor, antes o pedido é atendido
+PRIORITY_DETAIL = 0
+PRIORITY_DEFAULT = 1
+
+# Rotas POST que só leem (o corpo carrega a lista de IDs)
+READ_POST_SUFFIXES = ("/batch-get",)
+
+
+class AdmissionLimiter:
+    """
+    Limita a quantidade de requisições em andamento, com fila de espera priorizada.
+
+    :param limit: Máximo de requisições executando ao mesmo tempo.
+    :param max_queue: Máximo de requisições aguardando uma vaga.
+    :param timeout: Tempo máximo de espera na fila, em segundos.
+    """
+
+    def __init__(self, *, limit: int, max_queue: int, timeout: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> bool:
+        """Tenta obter uma vaga. Retorna False se a fila estiver cheia ou o prazo expirar."""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            return False
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._counter), future)
+        heapq.heappush(self._waiters, waiter)
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except TimeoutError:
+            self._discard(waiter)
+            # A vaga pode ter sido transferida no mesmo instante em que o prazo expirou
+            return future.done() and not future.cancelled()
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            if future.done() and not future.cancelled():
+                # A vaga foi transferida no mesmo instante em que o chamador desistiu
+                self.release()
+            raise
+        return True
+
+    def _discard(self, waiter: tuple[int, int, asyncio.Future[None]]) -> None:
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+
+    def release(self) -> None:
+        """Libera a vaga, transferindo-a diretamente para o próximo da fila."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI que controla a admissão de requisições que usam o banco.
+
+    Leituras (GET/HEAD e os POST de leitura, como `/batch-get`) e escritas têm
+    limites separados. Acima do limite as requisições aguardam em uma fila
+    limitada, onde buscas por ID são atendidas antes das listagens. Quando a fila
+    está cheia ou o prazo expira, responde imediatamente `503` com o cabeçalho
+    `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        read_limit: int,
+        write_limit: int,
+        max_queue: int,
+        queue_timeout_ms: float,
+        retry_after: int,
+        path_prefix: str = "/api/",
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.retry_after = retry_after
+        self.path_prefix = path_prefix
+        self.exclude_paths = set(exclude_paths)
+        timeout = queue_timeout_ms / 1000
+        self.read_limiter = AdmissionLimiter(limit=read_limit, max_queue=max_queue, timeout=timeout)
+        self.write_limiter = AdmissionLimiter(limit=write_limit, max_queue=max_queue, timeout=timeout)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith(self.path_prefix) or path in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in ("GET", "HEAD") or (
+            scope["method"] == "POST" and path.rstrip("/").endswith(READ_POST_SUFFIXES)
+        ):
+            limiter = self.read_limiter
+            priority = PRIORITY_DETAIL if _is_detail_path(path) else PRIORITY_DEFAULT
+        else:
+            limiter = self.write_limiter
+            priority = PRIORITY_DEFAULT
+
+        if not await limiter.acquire(priority):
+            response = JSONResponse(
+                {"detail": "Servidor sobrecarregado, tente novamente em instantes"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+def _is_detail_path(path: str) -> bool:
+    """Identifica rotas de busca por ID (último segmento é um UUID)."""
+    try:
+        UUID(path.rstrip("/").rsplit("/", 1)[-1])
+    except ValueError:
+        return False
+    return True
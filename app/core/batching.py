@@ -0,0 +1,126 @@
+import asyncio
+from typing import Any
+
+from sqlalchemy import exc
+
+from app.core.settings import settings
+
+__all__ = ["GroupCommitter", "get_group_committer"]
+
+
+class GroupCommitter:
+    """
+    Agrupa criações concorrentes em uma única transação (group commit).
+
+    As criações que chegam dentro da janela `window_ms` (ou até `max_batch` itens)
+    são gravadas com um único commit. Cada chamador recebe o seu próprio objeto
+    ou a exceção referente ao seu item (ex: CPF duplicado).
+
+    :param session_callable: Fábrica de sessões usada para gravar cada lote.
+    :param on_change: Callback chamado para cada item gravado, antes do commit.
+    :param window_ms: Tempo máximo de espera, em milissegundos, antes de gravar o lote.
+    :param max_batch: Quantidade máxima de itens por lote.
+    """
+
+    def __init__(self, session_callable: Any, on_change: Any, *, window_ms: float, max_batch: int):
+        self._session_callable = session_callable
+        self._on_change = on_change
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: list[tuple[Any, asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, db_obj: Any) -> Any:
+        """Enfileira um objeto e aguarda o commit do lote em que ele foi incluído."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((db_obj, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch: list[tuple[Any, asyncio.Future[Any]]]) -> None:
+        # Chamadores que desistiram (ex: cliente desconectou) não entram no lote
+        batch = [(db_obj, future) for db_obj, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            async with self._session_callable() as db_session:
+                db_objs = [db_obj for db_obj, _ in batch]
+                try:
+                    db_session.add_all(db_objs)
+                    await db_session.flush()
+                    for db_obj in db_objs:
+                        await self._on_change(db_session, "create", db_obj)
+                    await db_session.commit()
+                    errors: list[Exception | None] = [None] * len(batch)
+                except exc.IntegrityError:
+                    # Algum item violou uma restrição: grava item a item com savepoints
+                    # para isolar o erro de cada chamador, mantendo um único commit.
+                    await db_session.rollback()
+                    errors = await self._flush_each(db_session, db_objs)
+
+                for db_obj, error in zip(db_objs, errors):
+                    if error is None:
+                        await db_session.refresh(db_obj)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (db_obj, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(db_obj)
+            else:
+                future.set_exception(error)
+
+    async def _flush_each(self, db_session: Any, db_objs: list[Any]) -> list[Exception | None]:
+        errors: list[Exception | None] = []
+        for db_obj in db_objs:
+            try:
+                async with db_session.begin_nested():
+                    db_session.add(db_obj)
+                errors.append(None)
+            except exc.IntegrityError as e:
+                errors.append(e)
+        for db_obj, error in zip(db_objs, errors):
+            if error is None:
+                await self._on_change(db_session, "create", db_obj)
+        await db_session.commit()
+        return errors
+
+
+_group_committers: dict[Any, GroupCommitter] = {}
+
+
+def get_group_committer(model: Any, session_callable: Any, on_change: Any) -> GroupCommitter:
+    """Retorna o GroupCommitter compartilhado do modelo, criando-o se necessário."""
+    committer = _group_committers.get(model)
+    if committer is None:
+        committer = GroupCommitter(
+            session_callable,
+            on_change,
+            window_ms=settings.GROUP_COMMIT_WINDOW_MS,
+            max_batch=settings.GROUP_COMMIT_MAX_BATCH,
+        )
+        _group_committers[model] = committer
+    return committer
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import asyncpg
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.databases import get_async_engine
+from app.core.settings import settings
+
+__all__ = ["ChangeFeed", "Subscription", "change_feed", "publish_change"]
+
+CHANNEL = "workout_changes"
+_PENDING_CHANGES_KEY = "pending_changes"
+_RECONNECT_MAX_DELAY = 5.0
+# O payload do NOTIFY é limitado a 8000 bytes; acima disso os eventos vão em mais de um NOTIFY
+_MAX_PAYLOAD_BYTES = 7900
+_NOTIFY_SQL = sa.text(
+    f"SELECT pg_notify('{CHANNEL}', payload) FROM unnest(:payloads) AS payload"
+).bindparams(sa.bindparam("payloads", type_=postgresql.ARRAY(sa.Text)))
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Fila de eventos de um assinante do feed de mudanças.
+
+    Quando o buffer enche (consumidor lento), a assinatura é descartada e o
+    próximo `get()` retorna `None`, sinalizando o fim do stream.
+    """
+
+    def __init__(self, *, tables: Iterable[str] | None, buffer_size: int):
+        self.tables = set(tables) if tables is not None else None
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=buffer_size)
+
+    async def get(self) -> dict[str, Any] | None:
+        return await self._queue.get()
+
+    def _offer(self, change: dict[str, Any]) -> bool:
+        if self.tables is not None and change["table"] not in self.tables:
+            return True
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return False
+        return True
+
+
+class ChangeFeed:
+    """
+    Distribui eventos de mudança (create/update/delete) para os assinantes do processo.
+
+    No PostgreSQL os eventos chegam via LISTEN/NOTIFY (cada NOTIFY carrega a lista
+    de eventos de uma transação), por uma única conexão de escuta por worker,
+    aberta fora do pool (LISTEN prende a conexão). Se ela cair, é reaberta em
+    segundo plano enquanto houver assinantes; eventos emitidos durante a
+    reconexão são perdidos. Nos demais bancos (ex: SQLite) os eventos
+    são publicados diretamente em memória após o commit.
+    """
+
+    def __init__(self, *, buffer_size: int):
+        self.buffer_size = buffer_size
+        self._subscriptions: set[Subscription] = set()
+        self._listener: asyncpg.Connection | None = None
+        self._listener_lock = asyncio.Lock()
+        self._reconnect_task: asyncio.Task[None] | None = None
+
+    async def subscribe(self, *, tables: Iterable[str] | None = None) -> Subscription:
+        await self._ensure_listener()
+        subscription = Subscription(tables=tables, buffer_size=self.buffer_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def publish(self, change: dict[str, Any]) -> None:
+        for subscription in list(self._subscriptions):
+            if not subscription._offer(change):
+                self._subscriptions.discard(subscription)
+
+    async def close(self) -> None:
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        # Zera antes de fechar para que o callback de término não agende uma reconexão
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            await listener.close()
+
+    async def _ensure_listener(self) -> None:
+        engine = get_async_engine()
+        if engine.dialect.name != "postgresql" or self._listener is not None:
+            return
+        async with self._listener_lock:
+            if self._listener is not None:
+                return
+            dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+            connection = await asyncpg.connect(
+                dsn, server_settings={"application_name": f"workout-api-listener:{os.getpid()}"}
+            )
+            await connection.add_listener(CHANNEL, self._on_notify)
+            connection.add_termination_listener(self._on_listener_terminated)
+            self._listener = connection
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        for change in json.loads(payload):
+            self.publish(change)
+
+    def _on_listener_terminated(self, connection: asyncpg.Connection) -> None:
+        if connection is not self._listener:
+            return
+        logger.warning("Conexão de escuta do feed de mudanças caiu; reconectando")
+        self._listener = None
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = 0.1
+        # Sem assinantes não há por que escutar; o próximo subscribe reabre a conexão
+        while self._subscriptions and self._listener is None:
+            try:
+                await self._ensure_listener()
+            except (OSError, asyncpg.PostgresError):
+                logger.warning("Falha ao reabrir a conexão de escuta; nova tentativa em %.1f s", delay, exc_info=True)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+
+
+change_feed = ChangeFeed(buffer_size=settings.CHANGES_CLIENT_BUFFER)
+
+
+async def publish_change(db_session: AsyncSession, action: str, db_obj: Any) -> None:
+    """
+    Registra um evento de mudança na transação atual da sessão.
+
+    Deve ser chamado antes do commit: o evento só é entregue se a transação
+    for confirmada. Os eventos da transação são enviados juntos no commit (um
+    único NOTIFY no PostgreSQL, fila em memória nos demais bancos). Sem
+    `CHANGES_ENABLED`, não faz nada.
+    """
+    if not settings.CHANGES_ENABLED:
+        return
+    change = {"table": db_obj.__tablename__, "action": action, "id": str(db_obj.id)}
+    db_session.sync_session.info.setdefault(_PENDING_CHANGES_KEY, []).append(change)
+
+
+def _notify_payloads(changes: list[dict[str, Any]]) -> list[str]:
+    """Agrupa os eventos em listas JSON que cabem no payload do NOTIFY."""
+    payloads: list[str] = []
+    batch: list[str] = []
+    size = 2
+    for change in changes:
+        encoded = json.dumps(change)
+        if batch and size + len(encoded) + 1 > _MAX_PAYLOAD_BYTES:
+            payloads.append(f"[{','.join(batch)}]")
+            batch, size = [], 2
+        batch.append(encoded)
+        size += len(encoded) + 1
+    if batch:
+        payloads.append(f"[{','.join(batch)}]")
+    return payloads
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_pending_changes(session: Session) -> None:
+    # No PostgreSQL, uma única ida ao banco por transação, não uma por linha gravada
+    if not session.info.get(_PENDING_CHANGES_KEY) or session.get_bind().dialect.name != "postgresql":
+        return
+    changes = session.info.pop(_PENDING_CHANGES_KEY)
+    session.execute(_NOTIFY_SQL, {"payloads": _notify_payloads(changes)})
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_changes(session: Session) -> None:
+    for change in session.info.pop(_PENDING_CHANGES_KEY, []):
+        change_feed.publish(change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import json
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl
+
+from pydantic import BaseModel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+
+__all__ = ["SingleFlight", "RequestCoalescingMiddleware", "coalesced", "read_single_flight"]
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Compartilha uma única execução entre chamadas concorrentes com a mesma chave.
+
+    A primeira chamada (líder) executa a função; as demais aguardam o resultado
+    dela por até `max_wait` segundos e, depois disso, executam por conta própria.
+    Nada é guardado após a conclusão: não é um cache.
+    """
+
+    def __init__(self, *, max_wait: float):
+        self.max_wait = max_wait
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await self._follow(future, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        # Evita o aviso de exceção não lida quando não há seguidores
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            result = await fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _follow(self, future: asyncio.Future[T], fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.max_wait)
+        except TimeoutError:
+            return await fn()
+        except asyncio.CancelledError:
+            # O líder foi cancelado (ex: cliente desconectou), mas este chamador não
+            task = asyncio.current_task()
+            if future.cancelled() and task is not None and not task.cancelling():
+                return await fn()
+            raise
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True, by_alias=True)
+    return str(value)
+
+
+read_single_flight = SingleFlight(max_wait=settings.COALESCE_MAX_WAIT_MS / 1000)
+
+
+def coalesced(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Decorator para métodos de leitura do RepositoryBase.
+
+    Chamadas concorrentes idênticas compartilham a mesma consulta ao banco.
+    Chamadas com `async_session` explícita não são agrupadas, pois podem estar
+    dentro de uma transação do chamador.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, async_session: Any = None, **kwargs: Any) -> T:
+        if async_session is not None or not settings.COALESCE_ENABLED:
+            return await method(self, *args, async_session=async_session, **kwargs)
+        key = (
+            self.model,
+            method.__name__,
+            json.dumps([args, sorted(kwargs.items())], default=_encode),
+        )
+        return await read_single_flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+class RequestCoalescingMiddleware:
+    """
+    Middleware ASGI que agrupa requisições GET idênticas e concorrentes.
+
+    A chave é a rota mais a query string normalizada. Apenas a primeira
+    requisição executa a aplicação; as demais recebem a mesma resposta já
+    serializada.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        max_wait_ms: float,
+        path_prefix: str = "/api/",
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.path_prefix = path_prefix
+        self.exclude_paths = set(exclude_paths)
+        self.single_flight = SingleFlight(max_wait=max_wait_ms / 1000)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not path.startswith(self.path_prefix)
+            or path in self.exclude_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        query = sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True))
+        key = (path, tuple(query))
+        messages = await self.single_flight.do(key, lambda: self._capture(scope, receive))
+        for message in messages:
+            await send(message)
+
+    async def _capture(self, scope: Scope, receive: Receive) -> list[Message]:
+        messages: list[Message] = []
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+
+        await self.app(scope, receive, send)
+        return messages
@@ -0,0 +1,272 @@
+import hashlib
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependência opcional
+    zstandard = None
+
+__all__ = ["CompressionMiddleware", "available_encodings"]
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Codificações disponíveis, em ordem de preferência do servidor, com o nível usado
+_COMPRESSORS: dict[str, tuple[Callable[[int], Any], int]] = {}
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = (_ZstdCompressor, 3)
+if brotli is not None:
+    _COMPRESSORS["br"] = (_BrotliCompressor, 4)
+_COMPRESSORS["gzip"] = (_GzipCompressor, 6)
+
+
+def available_encodings() -> list[str]:
+    return list(_COMPRESSORS)
+
+
+def _negotiate(accept_encoding: str) -> str | None:
+    """
+    Escolhe a codificação a partir do cabeçalho Accept-Encoding (com q-values).
+
+    Entre codificações com o mesmo q, vale a ordem de preferência do servidor.
+    `*` vale para as codificações não listadas; `identity` com q maior que o
+    da melhor codificação (ou nenhuma aceita) mantém a resposta sem compressão.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in _COMPRESSORS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    if weights.get("identity", 0.0) > best_quality:
+        return None
+    return best
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime as respostas (gzip, e br/zstd se instalados).
+
+    - Respostas completas menores que `minimum_size` saem sem compressão.
+    - Respostas em streaming (mais de uma mensagem de corpo) são comprimidas
+      pedaço a pedaço, com flush a cada pedaço.
+    - Respostas GET 200 cacheáveis têm o corpo comprimido (até
+      `cache_max_body_size`) guardado em um LRU por (ETag, codificação):
+      leituras repetidas não comprimem de novo. Sem ETag da aplicação, é
+      gerado um ETag fraco com o blake2b do corpo.
+    - `text/event-stream` e respostas já codificadas passam direto.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        cache_size: int = 256,
+        cache_max_body_size: int = 1024 * 1024,
+        exclude_media_types: Iterable[str] = ("text/event-stream",),
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache_size = cache_size
+        self.cache_max_body_size = cache_max_body_size
+        self.exclude_media_types = set(exclude_media_types)
+        self.exclude_paths = set(exclude_paths)
+        self._cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        await _CompressionResponder(self, scope, encoding, send).run(receive)
+
+    def _cache_get(self, key: tuple[str, str]) -> bytes | None:
+        body = self._cache.get(key)
+        if body is not None:
+            self._cache.move_to_end(key)
+        return body
+
+    def _cache_put(self, key: tuple[str, str], body: bytes) -> None:
+        self._cache[key] = body
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+class _CompressionResponder:
+    """Estado de compressão de uma única resposta."""
+
+    def __init__(self, middleware: CompressionMiddleware, scope: Scope, encoding: str | None, send: Send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Message | None = None
+        self.compressor: Any = None
+        self.passthrough = False
+
+    async def run(self, receive: Receive) -> None:
+        await self.middleware.app(self.scope, receive, self.send_wrapper)
+
+    def _compressible(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return (
+            message["status"] not in (204, 304)
+            and "content-encoding" not in headers
+            and media_type not in self.middleware.exclude_media_types
+        )
+
+    def _cacheable(self, headers: MutableHeaders) -> bool:
+        cache_control = headers.get("cache-control", "").lower()
+        return (
+            self.middleware.cache_size > 0
+            and self.scope["method"] == "GET"
+            and self.start_message is not None
+            and self.start_message["status"] == 200
+            and "no-store" not in cache_control
+        )
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            if self._compressible(message):
+                # Cópia: a mesma mensagem pode ser reenviada a outros clientes (ex: coalescing)
+                self.start_message = {**message, "headers": list(message.get("headers", []))}
+            else:
+                self.passthrough = True
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        assert self.start_message is not None
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if self.compressor is None and not more_body:
+            await self._send_complete(headers, body)
+        elif self.compressor is None:
+            await self._start_stream(headers, body)
+        else:
+            chunk = self.compressor.compress(body)
+            chunk += self.compressor.flush() if more_body else self.compressor.finish()
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _send_complete(self, headers: MutableHeaders, body: bytes) -> None:
+        _add_vary(headers)
+        if self.encoding is None or len(body) < self.middleware.minimum_size:
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = None
+        cache_key = None
+        if self._cacheable(headers):
+            if "etag" not in headers:
+                headers["etag"] = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            cache_key = (headers["etag"], self.encoding)
+            compressed = self.middleware._cache_get(cache_key)
+        if compressed is None:
+            factory, level = _COMPRESSORS[self.encoding]
+            compressor = factory(level)
+            compressed = compressor.compress(body) + compressor.finish()
+            if cache_key is not None and len(compressed) <= self.middleware.cache_max_body_size:
+                self.middleware._cache_put(cache_key, compressed)
+
+        headers["content-encoding"] = self.encoding
+        headers["content-length"] = str(len(compressed))
+        await self.send(self.start_message)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self, headers: MutableHeaders, body: bytes) -> None:
+        _add_vary(headers)
+        if self.encoding is None:
+            self.passthrough = True
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": body, "more_body": True})
+            return
+        factory, level = _COMPRESSORS[self.encoding]
+        self.compressor = factory(level)
+        headers["content-encoding"] = self.encoding
+        del headers["content-length"]
+        await self.send(self.start_message)
+        chunk = self.compressor.compress(body) + self.compressor.flush()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": True})
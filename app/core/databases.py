@@ -1,22 +1,86 @@
+import os
 from collections.abc import AsyncIterator, AsyncGenerator
 
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from app.core.settings import settings
 from contextlib import asynccontextmanager
 
-__all__ = ["async_engine", "async_session", "get_async_context_session", "get_async_session"]
+__all__ = [
+    "get_async_engine",
+    "get_async_sessionmaker",
+    "dispose_async_engine",
+    "pool_size_per_worker",
+    "get_async_context_session",
+    "get_async_session",
+]
 
+# O engine é criado sob demanda em cada processo. Assim, workers criados por fork
+# (gunicorn, uvicorn --workers) nunca compartilham conexões do pool do processo pai.
+_async_engine: AsyncEngine | None = None
+_async_session: async_sessionmaker[AsyncSession] | None = None
+_engine_pid: int | None = None
+
+
+def _workers() -> int:
+    return settings.WORKERS or 1
+
+
+def pool_size_per_worker() -> int:
+    """Divide `DB_POOL_SIZE` entre os workers, com no mínimo uma conexão por processo."""
+    return max(1, settings.DB_POOL_SIZE // _workers())
+
+
+def get_async_engine() -> AsyncEngine:
+    """Retorna o engine do processo atual, criando-o na primeira chamada."""
+    global _async_engine, _async_session, _engine_pid
+    if _async_engine is None or _engine_pid != os.getpid():
+        connect_args = {}
+        if make_url(settings.DB_URL).get_driver_name() == "asyncpg":
+            # Identifica no pg_stat_activity o processo (worker) dono de cada conexão
+            connect_args["server_settings"] = {"application_name": f"workout-api:{os.getpid()}"}
+        _async_engine = create_async_engine(
+            settings.DB_URL,
+            pool_size=pool_size_per_worker(),
+            max_overflow=settings.DB_MAX_OVERFLOW // _workers(),
+            connect_args=connect_args,
+        )
+        _async_session = async_sessionmaker(_async_engine, expire_on_commit=False)
+        _engine_pid = os.getpid()
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    get_async_engine()
+    assert _async_session is not None
+    return _async_session
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session, _engine_pid
+    if _async_engine is not None and _engine_pid == os.getpid():
+        await _async_engine.dispose()
+    _async_engine = _async_session = _engine_pid = None
+
+
+def _reset_engine_after_fork() -> None:
+    # No processo filho, descarta o pool herdado sem fechar as conexões do pai
+    global _async_engine, _async_session, _engine_pid
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+    _async_engine = _async_session = _engine_pid = None
+
+
+os.register_at_fork(after_in_child=_reset_engine_after_fork)
 
-async_engine = create_async_engine(settings.DB_URL)
-async_session = async_sessionmaker(async_engine, expire_on_commit=False)
 
 @asynccontextmanager
 async def get_async_context_session() -> AsyncIterator[AsyncSession]:
-    async with async_session() as session:
+    async with get_async_sessionmaker()() as session:
         yield session
 
 async def get_async_session() -> AsyncGenerator[AsyncSession]:
-    async with async_session() as session:
+    async with get_async_sessionmaker()() as session:
         yield session
         await session.close()
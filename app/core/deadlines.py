@@ -0,0 +1,171 @@
+import asyncio
+import math
+from collections.abc import Iterable
+from contextvars import ContextVar
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = [
+    "DeadlineExceeded",
+    "QueryMetrics",
+    "query_metrics",
+    "get_request_deadline",
+    "RequestDeadlineMiddleware",
+]
+
+TIMEOUT_HEADER = b"x-request-timeout-ms"
+# Margem para que o timeout do repositório responda antes do corte feito pelo middleware
+_BACKSTOP_GRACE = 0.1
+
+# Prazo da requisição atual, no relógio do event loop (loop.time())
+_request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class QueryMetrics:
+    """Contadores de queries interrompidas, expostos em /metrics."""
+
+    def __init__(self) -> None:
+        self.cancelled_queries = 0
+        self.deadline_exceeded = 0
+        self.client_disconnects = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+query_metrics = QueryMetrics()
+
+
+def get_request_deadline() -> float | None:
+    return _request_deadline.get()
+
+
+class RequestDeadlineMiddleware:
+    """
+    Middleware ASGI que aplica um prazo por requisição e cancela o trabalho abandonado.
+
+    O prazo vem do cabeçalho `X-Request-Timeout-Ms` (limitado por `max_timeout_ms`)
+    ou de `default_timeout_ms`, e é propagado para os repositórios. Se o cliente
+    desconectar ou o prazo expirar, a execução da rota é cancelada, o que cancela a
+    query no servidor (asyncpg) e devolve a conexão ao pool imediatamente. Depois
+    que o corpo da resposta foi enviado por completo, nada mais é cancelado.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        default_timeout_ms: float | None,
+        max_timeout_ms: float,
+        path_prefix: str = "/api/",
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.default_timeout_ms = default_timeout_ms
+        self.max_timeout_ms = max_timeout_ms
+        self.path_prefix = path_prefix
+        self.exclude_paths = set(exclude_paths)
+
+    def _timeout(self, scope: Scope) -> float | None:
+        timeout_ms = self.default_timeout_ms
+        for name, value in scope["headers"]:
+            if name == TIMEOUT_HEADER:
+                try:
+                    requested_ms = float(value)
+                except ValueError:
+                    break
+                # "nan", "inf", zero ou negativo são ignorados (valeria o padrão)
+                if math.isfinite(requested_ms) and requested_ms > 0:
+                    timeout_ms = requested_ms
+                break
+        if timeout_ms is None:
+            return None
+        return min(timeout_ms, self.max_timeout_ms) / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or not path.startswith(self.path_prefix) or path in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Lê o corpo antes, para que depois disso o `receive` real só sirva para detectar desconexão
+        body_messages: list[Message] = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                query_metrics.client_disconnects += 1
+                return
+            body_messages.append(message)
+            if not message.get("more_body", False):
+                break
+
+        disconnected = asyncio.Event()
+
+        async def replay_receive() -> Message:
+            if body_messages:
+                return body_messages.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        response_started = False
+        response_complete = asyncio.Event()
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete.set()
+
+        async def watch_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        loop = asyncio.get_running_loop()
+        timeout = self._timeout(scope)
+        token = _request_deadline.set(loop.time() + timeout if timeout is not None else None)
+        try:
+            app_task = asyncio.create_task(self.app(scope, replay_receive, tracking_send))
+        finally:
+            _request_deadline.reset(token)
+        watcher = asyncio.create_task(watch_disconnect())
+        completion = asyncio.create_task(response_complete.wait())
+
+        try:
+            done, _ = await asyncio.wait(
+                {app_task, watcher, completion},
+                timeout=timeout + _BACKSTOP_GRACE if timeout is not None else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            watcher.cancel()
+            completion.cancel()
+            if not app_task.done() and not response_complete.is_set():
+                app_task.cancel()
+
+        if app_task in done or response_complete.is_set():
+            # Resposta já enviada: o servidor reporta desconexão ao fim da resposta, mas o
+            # trabalho posterior (BackgroundTasks, finalização de dependências) roda até o fim
+            await app_task
+            return
+
+        # Desconexão ou prazo expirado: aguarda o cancelamento liberar a conexão
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            pass
+        if watcher in done:
+            query_metrics.client_disconnects += 1
+            return
+
+        query_metrics.deadline_exceeded += 1
+        if not response_started:
+            response = JSONResponse({"detail": "Tempo limite da requisição excedido"}, status_code=504)
+            await response(scope, receive, send)
@@ -0,0 +1,28 @@
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+__all__ = ["Explain"]
+
+
+class Explain(Executable, ClauseElement):
+    """
+    Construct `EXPLAIN` do PostgreSQL para qualquer statement SQLAlchemy.
+
+    Os parâmetros do statement original são mantidos como bind params.
+
+    :param statement: Statement a ser explicado.
+    :param options: Opções do EXPLAIN (ex: "ANALYZE", "BUFFERS").
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any, *options: str):
+        self.statement = statement
+        self.options = ("FORMAT JSON", *options)
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return f"EXPLAIN ({', '.join(element.options)}) {compiler.process(element.statement, **kw)}"
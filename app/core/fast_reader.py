@@ -0,0 +1,65 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from app.core.databases import get_async_engine
+from app.core.deadlines import DeadlineExceeded, get_request_deadline, query_metrics
+from app.core.settings import settings
+
+__all__ = ["FastReader", "fast_reader"]
+
+
+class FastReader:
+    """
+    Executa SQL cru direto na conexão asyncpg, sem ORM.
+
+    As conexões vêm do mesmo pool do `async_engine`. O asyncpg prepara cada SQL
+    uma vez por conexão e guarda o statement em cache, então as próximas
+    execuções só enviam os parâmetros. Os registros são retornados como vieram
+    do driver: cabe a quem chama montar o formato de saída.
+
+    Só é usado com PostgreSQL (driver asyncpg) e com `FAST_READER_ENABLED`;
+    fora disso, `available()` retorna False e quem chama usa o ORM.
+    """
+
+    def available(self) -> bool:
+        return settings.FAST_READER_ENABLED and get_async_engine().dialect.driver == "asyncpg"
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        async with get_async_engine().connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            yield raw_connection.driver_connection
+
+    async def _run(self, method: str, sql: str, *args: Any) -> Any:
+        # Mesmo tratamento de prazo do RepositoryBase._execute: ao cancelar a
+        # task, o asyncpg cancela a query no servidor.
+        deadline = get_request_deadline()
+        try:
+            async with self._connection() as connection:
+                if deadline is None:
+                    return await getattr(connection, method)(sql, *args)
+                async with asyncio.timeout_at(deadline):
+                    return await getattr(connection, method)(sql, *args)
+        except TimeoutError as e:
+            query_metrics.cancelled_queries += 1
+            raise DeadlineExceeded("Prazo da requisição excedido durante a leitura rápida.") from e
+        except asyncio.CancelledError:
+            query_metrics.cancelled_queries += 1
+            raise
+
+    async def fetch(self, sql: str, *args: Any) -> list[Any]:
+        """Executa a query e retorna todos os registros."""
+        return await self._run("fetch", sql, *args)
+
+    async def fetchrow(self, sql: str, *args: Any) -> Any | None:
+        """Executa a query e retorna o primeiro registro, ou None."""
+        return await self._run("fetchrow", sql, *args)
+
+    async def fetchval(self, sql: str, *args: Any) -> Any:
+        """Executa a query e retorna a primeira coluna do primeiro registro."""
+        return await self._run("fetchval", sql, *args)
+
+
+fast_reader = FastReader()
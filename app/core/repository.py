@@ -1,17 +1,32 @@
 # app/repositories/base.py
+import asyncio
+import json
+import logging
 import operator
 from typing import Any, Generic, TypeVar, AsyncContextManager
-from collections.abc import Sequence, Callable
+from collections import defaultdict
+from collections.abc import Awaitable, Sequence, Callable
 import math
 
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select, func
+from sqlalchemy import any_, bindparam, select, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql import ColumnElement, Executable
 
+from app.core.batching import get_group_committer
+from app.core.changes import publish_change
+from app.core.coalescing import coalesced
+from app.core.deadlines import DeadlineExceeded, get_request_deadline, query_metrics
+from app.core.explain import Explain
+from app.core.settings import settings
 
 
-__all__ = ["RepositoryBase", "AsyncSessionCallable", "Page", "PageInput", "get_pagineted_input"]
+__all__ = ["RepositoryBase", "AsyncSessionCallable", "Page", "PageInput", "get_pagineted_input", "ExpensiveQueryError", "register_change_hook"]
+
+logger = logging.getLogger(__name__)
 
 # Tipos para injeção de dependência da sessão
 #type AsyncSessionCallable = Callable[[], AsyncGenerator[AsyncContextManager[AsyncSession, None]]]
@@ -49,6 +64,21 @@ class ModelNotFound(Exception):
 class AsyncSessionError(Exception):
     pass
 
+class ExpensiveQueryError(Exception):
+    pass
+
+# Hooks executados na mesma transação de cada escrita (create/update/delete), por modelo
+ChangeHook = Callable[[AsyncSession, str, Any], Awaitable[None]]
+_change_hooks: defaultdict[type, list[ChangeHook]] = defaultdict(list)
+
+
+def register_change_hook(model: type, hook: ChangeHook) -> None:
+    """Registra um hook chamado antes do commit de toda escrita do modelo feita pelo RepositoryBase."""
+    _change_hooks[model].append(hook)
+
+# Custo estimado pelo planner para cada formato de filtro/ordenação já visto
+_query_costs: dict[tuple[Any, ...], float] = {}
+
 class RepositoryBase(
     Generic[ModelType, CreateSchemaType, UpdateSchemaType, FilterSchemaType]
 ):
@@ -86,6 +116,10 @@ class RepositoryBase(
             "in": lambda col, val: col.in_(val), # type: ignore
             "notin": lambda col, val: col.not_in(val), # type: ignore
         }
+
+        # Filtros que não mapeiam direto para uma coluna do modelo (ex: UUID público de
+        # uma FK). Cada chave do filtro recebe o valor e retorna a condição do WHERE.
+        self.filter_resolvers: dict[str, Callable[[Any], ColumnElement[bool]]] = {}
     async def _get_session(self, async_session: AsyncSession | None = None) -> AsyncSession:
         if async_session is None:
             if self._session_callable is None:
@@ -94,11 +128,113 @@ class RepositoryBase(
                 return async_session
         return async_session
 
+    async def _execute(self, db_session: AsyncSession, statement: Executable, *, origin: str) -> Result[Any]:
+        """
+        Executa a query respeitando o prazo da requisição atual.
+
+        Se o prazo expirar ou a requisição for cancelada, a query é cancelada no
+        servidor e a conexão volta ao pool. `origin` é o método do repositório que
+        gerou a query (usado no registro de queries lentas).
+        """
+        deadline = get_request_deadline()
+        execution_options = {"origin": f"{type(self).__name__}.{origin}"}
+        try:
+            if deadline is None:
+                return await db_session.execute(statement, execution_options=execution_options)
+            async with asyncio.timeout_at(deadline):
+                return await db_session.execute(statement, execution_options=execution_options)
+        except TimeoutError as e:
+            query_metrics.cancelled_queries += 1
+            raise DeadlineExceeded(f"Prazo da requisição excedido ao consultar '{self.model.__name__}'.") from e
+        except asyncio.CancelledError:
+            query_metrics.cancelled_queries += 1
+            raise
+
+    async def _on_change(self, db_session: AsyncSession, action: str, db_obj: ModelType) -> None:
+        """Executa os hooks de escrita e publica o evento de mudança, antes do commit."""
+        hooks = _change_hooks.get(self.model, [])
+        if hooks:
+            await db_session.flush()
+        for hook in hooks:
+            await hook(db_session, action, db_obj)
+        await publish_change(db_session, action, db_obj)
+
+    async def _check_query_cost(
+        self,
+        db_session: AsyncSession,
+        statements: Sequence[Executable],
+        filter_params: dict[str, Any],
+        sort_by: dict[str, int] | None,
+        *,
+        rows: int,
+    ) -> None:
+        """
+        Verifica com `EXPLAIN` o custo estimado das queries que serão executadas.
+
+        `statements` são as queries exatamente como serão executadas (com
+        LIMIT/OFFSET e a contagem, quando houver); o custo considerado é o da mais
+        cara. O veredito é guardado por formato (campos filtrados + ordenação + ordem
+        de grandeza de `rows`, as linhas percorridas até o fim da página), então o
+        `EXPLAIN` roda apenas na primeira vez de cada formato. Acima de
+        `QUERY_GUARD_MAX_COST` a query é registrada no log ou rejeitada, conforme
+        `QUERY_GUARD_MODE`.
+        """
+        if not settings.QUERY_GUARD_ENABLED or db_session.bind.dialect.name != "postgresql":
+            return
+        shape = (
+            self.model.__tablename__,
+            tuple(sorted(filter_params)),
+            tuple((sort_by or {}).items()),
+            rows.bit_length(),
+        )
+        cost = _query_costs.get(shape)
+        if cost is None:
+            costs = []
+            for statement in statements:
+                plan = (await db_session.execute(Explain(statement))).scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                costs.append(plan[0]["Plan"]["Total Cost"])
+            cost = _query_costs[shape] = max(costs)
+        if cost <= settings.QUERY_GUARD_MAX_COST:
+            return
+        logger.warning("Query cara em '%s' (custo estimado %.0f) para o formato %s", self.model.__tablename__, cost, shape)
+        if settings.QUERY_GUARD_MODE == "reject":
+            raise ExpensiveQueryError(
+                f"A combinação de filtros {list(shape[1])} em '{self.model.__tablename__}' não é suportada."
+            )
+
+    @coalesced
     async def get(self, id: Any, async_session: AsyncSession | None = None) -> ModelType | None:
         """Busca um objeto pelo seu ID."""
         db_session = await self._get_session(async_session)
-        return await db_session.get(self.model, id)
+        return await db_session.get(self.model, id, execution_options={"origin": f"{type(self).__name__}.get"})
+
+    @coalesced
+    async def get_many(
+        self, ids: Sequence[Any], async_session: AsyncSession | None = None
+    ) -> list[ModelType | None]:
+        """
+        Busca vários objetos pelos seus IDs em uma única query.
+
+        Retorna os objetos na mesma ordem dos IDs recebidos, com `None` para os
+        IDs não encontrados.
+        """
+        if not ids:
+            return []
+        db_session = await self._get_session(async_session)
+        unique_ids = list(dict.fromkeys(ids))
+        if db_session.bind.dialect.name == "postgresql":
+            # Um único parâmetro de array mantém a query igual (e em cache) para qualquer quantidade de IDs
+            ids_param = bindparam("ids", unique_ids, type_=postgresql.ARRAY(self.model.id.type))
+            condition = self.model.id == any_(ids_param)
+        else:
+            condition = self.model.id.in_(unique_ids)
+        result = await self._execute(db_session, select(self.model).where(condition), origin="get_many")
+        found = {db_obj.id: db_obj for db_obj in result.scalars()}
+        return [found.get(id) for id in ids]
 
+    @coalesced
     async def paginate(
         self,
         *,
@@ -127,27 +263,34 @@ class RepositoryBase(
         filter_params = filter_in.model_dump(exclude_none=True, by_alias=True)
 
         for key, value in filter_params.items():
+            if key in self.filter_resolvers:
+                query = query.where(self.filter_resolvers[key](value))
+                continue
             field_name, op_suffix = key.rsplit("__", 1) if "__" in key else (key, "eq")
             op_func = self.filter_operators[op_suffix]
             column = getattr(self.model, field_name)
             query = query.where(op_func(column, value))
 
-        # 2. Criar uma query para contar o total de itens que correspondem ao filtro
-        # A subquery é usada para garantir que a contagem respeite os filtros
-        count_query = select(func.count()).select_from(query.order_by(None).subquery())
-        total_items = (await db_session.execute(count_query)).scalar_one()
-
-        # 3. Aplicar ordenação à query principal
+        # 2. Aplicar ordenação à query principal
         if sort_by:
             for field, direction in sort_by.items():
                 column = getattr(self.model, field)
                 query = query.order_by(column.desc() if direction == -1 else column.asc())
-        
+
+        # 3. Criar uma query para contar o total de itens que correspondem ao filtro
+        # A subquery é usada para garantir que a contagem respeite os filtros
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+
         # 4. Aplicar paginação (offset/limit) para buscar os itens da página
         offset = (page - 1) * size
         paginated_query = query.offset(offset).limit(size)
-        
-        result = await db_session.execute(paginated_query)
+
+        await self._check_query_cost(
+            db_session, [count_query, paginated_query], filter_params, sort_by, rows=offset + size
+        )
+        total_items = (await self._execute(db_session, count_query, origin="paginate")).scalar_one()
+
+        result = await self._execute(db_session, paginated_query, origin="paginate")
         items = result.scalars().all()
 
         # 5. Calcular o total de páginas e construir o objeto de resposta
@@ -162,15 +305,17 @@ class RepositoryBase(
         )
 
 
+    @coalesced
     async def list_all(
         self, *, skip: int = 0, limit: int = 100, async_session: AsyncSession | None = None
     ) -> Sequence[ModelType]:
         """Busca múltiplos objetos com paginação."""
         db_session = await self._get_session(async_session)
         statement = select(self.model).offset(skip).limit(limit)
-        result = await db_session.execute(statement)
+        result = await self._execute(db_session, statement, origin="list_all")
         return result.scalars().all()
 
+    @coalesced
     async def find_all(
         self,
         *,
@@ -189,6 +334,9 @@ class RepositoryBase(
         filter_params = filter_in.model_dump(exclude_none=True, by_alias=True)
 
         for key, value in filter_params.items():
+            if key in self.filter_resolvers:
+                statement = statement.where(self.filter_resolvers[key](value))
+                continue
             field_name, op_suffix = key.rsplit("__", 1) if "__" in key else (key, "eq")
 
             if op_suffix not in self.filter_operators:
@@ -219,11 +367,14 @@ class RepositoryBase(
                     raise ValueError(
                         f"Direção de ordenação inválida para '{field}': {direction}. Use 1 para asc ou -1 para desc."
                     )
-                    
+
+
         statement = statement.offset(skip).limit(limit)
-        result = await db_session.execute(statement)
+        await self._check_query_cost(db_session, [statement], filter_params, sort_by, rows=skip + limit)
+        result = await self._execute(db_session, statement, origin="find_all")
         return result.scalars().all()
 
+    @coalesced
     async def find_one(
         self,
         *,
@@ -241,19 +392,37 @@ class RepositoryBase(
     ) -> ModelType:
         """Cria um novo objeto no banco."""
         db_session = await self._get_session(async_session)
-        if isinstance(obj_in, self.model):
-            db_obj = obj_in
-        elif isinstance(obj_in, dict):
-            db_obj = self.model(**obj_in)
-        elif isinstance(obj_in, self.create_schema):
-            db_obj = self.model(**obj_in.model_dump())
-        else:
-            raise TypeError
+        db_obj = self._to_model(obj_in)
         db_session.add(db_obj)
+        await db_session.flush()
+        await self._on_change(db_session, "create", db_obj)
         await db_session.commit()
         await db_session.refresh(db_obj)
         return db_obj
 
+    async def create_grouped(self, *, obj_in: CreateSchemaType | ModelType) -> ModelType:
+        """
+        Cria um novo objeto agrupando o commit com outras criações concorrentes.
+
+        O objeto é gravado junto com as demais criações do mesmo modelo que chegarem
+        dentro da janela de group commit configurada em `Settings`. Erros de
+        integridade (ex: CPF duplicado) são propagados apenas ao chamador do item.
+        """
+        if self._session_callable is None:
+            raise AsyncSessionError()
+        db_obj = self._to_model(obj_in)
+        committer = get_group_committer(self.model, self._session_callable, self._on_change)
+        return await committer.submit(db_obj)
+
+    def _to_model(self, obj_in: CreateSchemaType | ModelType) -> ModelType:
+        if isinstance(obj_in, self.model):
+            return obj_in
+        elif isinstance(obj_in, dict):
+            return self.model(**obj_in)
+        elif isinstance(obj_in, self.create_schema):
+            return self.model(**obj_in.model_dump())
+        raise TypeError
+
     async def create_many(
         self, *, obj_in: Sequence[CreateSchemaType], async_session: AsyncSession | None = None
     ) -> Sequence[ModelType]:
@@ -261,6 +430,9 @@ class RepositoryBase(
         db_session = await self._get_session(async_session)
         db_objs = [self.model(**obj.model_dump()) for obj in obj_in]
         db_session.add_all(db_objs)
+        await db_session.flush()
+        for db_obj in db_objs:
+            await self._on_change(db_session, "create", db_obj)
         await db_session.commit()
         for db_obj in db_objs:
             await db_session.refresh(db_obj)
@@ -280,6 +452,7 @@ class RepositoryBase(
             setattr(db_obj, field, value)
 
         db_session.add(db_obj)
+        await self._on_change(db_session, "update", db_obj)
         await db_session.commit()
         await db_session.refresh(db_obj)
         return db_obj
@@ -290,5 +463,6 @@ class RepositoryBase(
         obj = await db_session.get(self.model, id)
         if obj:
             await db_session.delete(obj)
+            await self._on_change(db_session, "delete", obj)
             await db_session.commit()
         return obj
\ No newline at end of file
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+import asyncpg
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.databases import get_async_engine
+from app.core.settings import settings
+
+__all__ = ["SlowQueryRecorder", "SlowQueryRouteMiddleware", "slow_query_recorder"]
+
+logger = logging.getLogger(__name__)
+
+# Scope ASGI da requisição atual, para registrar a rota de origem de cada query
+_current_scope: ContextVar[Scope | None] = ContextVar("current_scope", default=None)
+
+# Listas de placeholders (ex: IN ($1, $2, $3)) viram um único marcador
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\$\d+|\?|%s|%\(\w+\)s)(?:\s*,\s*(?:\$\d+|\?|%s|%\(\w+\)s))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_sql(statement: str) -> str:
+    return _PLACEHOLDER_LIST.sub("(...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def _parameter_shape(parameters: Any, executemany: bool) -> Any:
+    """Tipos dos parâmetros, sem os valores (que podem conter dados pessoais)."""
+    if executemany:
+        return {"executemany": len(parameters)}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def _route() -> dict[str, str | None] | None:
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    # O endpoint só é conhecido depois do roteamento, que preenche o mesmo scope
+    endpoint = scope.get("endpoint")
+    return {
+        "method": scope["method"],
+        "path": scope["path"],
+        "endpoint": f"{endpoint.__module__}.{endpoint.__qualname__}" if endpoint else None,
+    }
+
+
+class SlowQueryRecorder:
+    """
+    Registra as queries que passam de `SLOW_QUERY_THRESHOLD_MS`.
+
+    Cada registro guarda o SQL normalizado, os tipos dos parâmetros, o método do
+    repositório (execution option `origin`) e a rota da requisição. Uma fração
+    `SLOW_QUERY_EXPLAIN_SAMPLE_RATE` dos SELECTs lentos ganha um
+    `EXPLAIN (ANALYZE, BUFFERS)` (PostgreSQL), rodado em segundo plano em uma
+    conexão aberta fora do pool das requisições e limitado por
+    `SLOW_QUERY_EXPLAIN_TIMEOUT_MS`. Só um EXPLAIN roda por vez: amostras que
+    chegam enquanto outro está rodando são registradas sem plano.
+
+    Os registros ficam em um buffer circular (GET /api/v1/admin/slow-queries) e,
+    se `SLOW_QUERY_LOG_PATH` estiver definido, em um arquivo JSONL rotativo.
+    """
+
+    def __init__(
+        self, *, threshold_ms: float, explain_sample_rate: float, explain_timeout_ms: int, buffer_size: int
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self.records: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+        self._file_logger: logging.Logger | None = None
+        self._explain_task: asyncio.Task[None] | None = None
+
+    def install(self) -> None:
+        """Escuta a execução de queries em todos os engines."""
+        if settings.SLOW_QUERY_LOG_PATH and self._file_logger is None:
+            handler = RotatingFileHandler(
+                settings.SLOW_QUERY_LOG_PATH,
+                maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+                backupCount=settings.SLOW_QUERY_LOG_BACKUPS,
+                encoding="utf-8",
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_logger = logging.getLogger(f"{__name__}.file")
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.propagate = False
+            self._file_logger.addHandler(handler)
+        if not event.contains(Engine, "before_cursor_execute", self._before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(Engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    def _handle_error(self, exception_context: Any) -> None:
+        # Query com erro não passa pelo after_cursor_execute
+        starts = exception_context.connection.info.get("slow_query_start") if exception_context.connection else None
+        if starts:
+            starts.pop()
+
+    def _after_cursor_execute(
+        self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["slow_query_start"].pop()
+        if elapsed < self.threshold:
+            return
+        record = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed * 1000, 3),
+            "sql": _normalize_sql(statement),
+            "parameters": _parameter_shape(parameters, executemany),
+            "origin": context.execution_options.get("origin"),
+            "route": _route(),
+            "plan": None,
+        }
+        if (
+            conn.dialect.name == "postgresql"
+            and conn.dialect.is_async
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+            and (self._explain_task is None or self._explain_task.done())
+            and random.random() < self.explain_sample_rate
+        ):
+            # O EXPLAIN roda depois, fora da requisição que disparou a query
+            self._explain_task = asyncio.get_running_loop().create_task(self._explain(record, statement, parameters))
+            return
+        self._store(record)
+
+    async def _explain(self, record: dict[str, Any], statement: str, parameters: Any) -> None:
+        # Conexão própria, fora do pool: o EXPLAIN ANALYZE repete a query lenta e não
+        # pode ocupar uma conexão das requisições. Os parâmetros já estão no formato do asyncpg.
+        dsn = get_async_engine().url.set(drivername="postgresql").render_as_string(hide_password=False)
+        try:
+            connection = await asyncpg.connect(dsn, server_settings={
+                "application_name": f"workout-api-explain:{os.getpid()}",
+                "statement_timeout": str(self.explain_timeout_ms),
+            })
+            try:
+                transaction = connection.transaction()
+                await transaction.start()
+                plan = await connection.fetchval(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", *parameters)
+                await transaction.rollback()
+            finally:
+                await connection.close()
+            record["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+        except Exception:
+            logger.warning("Falha ao rodar EXPLAIN da query lenta", exc_info=True)
+        self._store(record)
+
+    def _store(self, record: dict[str, Any]) -> None:
+        self.records.append(record)
+        logger.warning("Query lenta (%.1f ms) em %s: %s", record["duration_ms"], record["origin"], record["sql"])
+        if self._file_logger is not None:
+            self._file_logger.info(json.dumps(record, default=str))
+
+
+class SlowQueryRouteMiddleware:
+    """Middleware ASGI que expõe a rota da requisição atual ao SlowQueryRecorder."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+
+
+slow_query_recorder = SlowQueryRecorder(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    explain_timeout_ms=settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+)
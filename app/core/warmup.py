@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
+
+from app.core.databases import get_async_engine
+
+__all__ = ["warm_up", "register_warm_up_queries"]
+
+logger = logging.getLogger(__name__)
+
+# Funções que executam, cada uma, as consultas das rotas mais usadas de um módulo
+WarmUpQueries = Callable[[], Awaitable[None]]
+_warm_up_queries: list[WarmUpQueries] = []
+
+
+def register_warm_up_queries(queries: WarmUpQueries) -> None:
+    """Registra as consultas de um módulo executadas no aquecimento."""
+    _warm_up_queries.append(queries)
+
+
+async def _open_pool_connections(connections: int) -> None:
+    """Abre `connections` conexões ao mesmo tempo e as devolve ao pool."""
+    async def _checkout() -> None:
+        async with get_async_engine().connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+
+    await asyncio.gather(*(_checkout() for _ in range(connections)))
+
+
+async def _run_hot_queries(connections: int) -> None:
+    """
+    Executa as consultas registradas, `connections` vezes em paralelo.
+
+    São as mesmas chamadas de repositório das rotas, então populam o cache de
+    compilação do engine e os loaders `selectin` com as chaves que as primeiras
+    requisições vão usar. Em paralelo, cada conexão do pool também prepara os
+    seus statements (asyncpg e FastReader guardam os prepared statements por conexão).
+    """
+    async def _run() -> None:
+        for queries in _warm_up_queries:
+            await queries()
+
+    await asyncio.gather(*(_run() for _ in range(max(1, connections))))
+
+
+async def warm_up(app: FastAPI, *, connections: int, timeout: float) -> None:
+    """
+    Prepara a aplicação para que as primeiras requisições tenham a latência normal.
+
+    O aquecimento é opcional: se o banco estiver indisponível ou demorar mais que
+    `timeout` segundos, a falha vai para o log e a aplicação sobe mesmo assim.
+    """
+    configure_mappers()
+    # O schema OpenAPI é gerado sob demanda; gera agora para o primeiro acesso a /docs
+    app.openapi()
+    try:
+        async with asyncio.timeout(timeout):
+            await _open_pool_connections(connections)
+            await _run_hot_queries(connections)
+    except Exception:
+        logger.warning("Aquecimento do banco falhou; a aplicação sobe sem ele", exc_info=True)
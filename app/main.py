@@ -1,8 +1,93 @@
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from .core.admission import AdmissionControlMiddleware
+from .core.changes import change_feed
+from .core.coalescing import RequestCoalescingMiddleware
+from .core.compression import CompressionMiddleware
+from .core.databases import dispose_async_engine, pool_size_per_worker
+from .core.deadlines import DeadlineExceeded, RequestDeadlineMiddleware, query_metrics
+from .core.repository import ExpensiveQueryError
+from .core.settings import settings
+from .core.slow_queries import SlowQueryRouteMiddleware, slow_query_recorder
+from .core.warmup import warm_up
 from .routers import router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    if settings.WARMUP_ENABLED:
+        await warm_up(
+            app,
+            connections=min(settings.WARMUP_CONNECTIONS, pool_size_per_worker()),
+            timeout=settings.WARMUP_TIMEOUT_SECONDS,
+        )
+    yield
+    await change_feed.close()
+    await dispose_async_engine()
+
+
+# Rotas de stream (longa duração) ficam fora dos middlewares que medem ou agrupam requisições
+STREAMING_PATHS = {"/api/v1/athletes/changes"}
+
 app = FastAPI(
     title="Workout API",
+    lifespan=lifespan,
 )
 
 app.include_router(router, prefix="/api/v1")
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    query_metrics.deadline_exceeded += 1
+    return JSONResponse({"detail": "Tempo limite da requisição excedido"}, status_code=504)
+
+
+@app.exception_handler(ExpensiveQueryError)
+async def expensive_query_handler(request: Request, exc: ExpensiveQueryError):
+    return JSONResponse({"detail": str(exc)}, status_code=400)
+
+
+if settings.SLOW_QUERY_ENABLED:
+    slow_query_recorder.install()
+    app.add_middleware(SlowQueryRouteMiddleware)
+
+if settings.DEADLINE_ENABLED:
+    app.add_middleware(
+        RequestDeadlineMiddleware,
+        default_timeout_ms=settings.REQUEST_TIMEOUT_MS,
+        max_timeout_ms=settings.REQUEST_MAX_TIMEOUT_MS,
+        exclude_paths=STREAMING_PATHS,
+    )
+
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        read_limit=settings.ADMISSION_READ_LIMIT or pool_size_per_worker(),
+        write_limit=settings.ADMISSION_WRITE_LIMIT or pool_size_per_worker(),
+        max_queue=settings.ADMISSION_MAX_QUEUE,
+        queue_timeout_ms=settings.ADMISSION_QUEUE_TIMEOUT_MS,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+        exclude_paths=STREAMING_PATHS,
+    )
+
+# Adicionado por último para ficar por fora: seguidores não ocupam vagas de admissão
+if settings.COALESCE_ENABLED:
+    app.add_middleware(
+        RequestCoalescingMiddleware,
+        max_wait_ms=settings.COALESCE_MAX_WAIT_MS,
+        exclude_paths=STREAMING_PATHS,
+    )
+
+# A compressão fica por fora de todos: respostas agrupadas são comprimidas uma única vez por ETag
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        cache_size=settings.COMPRESSION_CACHE_SIZE,
+        cache_max_body_size=settings.COMPRESSION_CACHE_MAX_BODY_SIZE,
+        exclude_paths=STREAMING_PATHS,
+    )
@@ -1,3 +1,4 @@
-from .models import *
-from .controller import *
-from .schemas import *
\ No newline at end of file
+from .models import AthleteModel
+from .schemas import AthleteInput, AthleteOutput, AthleteUpdate, AthleteFilter, ListAthleteOutput
+
+__all__ = ["AthleteModel", "AthleteInput", "AthleteOutput", "AthleteUpdate", "AthleteFilter", "ListAthleteOutput"]
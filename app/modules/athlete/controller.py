@@ -1,17 +1,27 @@
+import asyncio
+import json
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.contrib.dependencies import *
-from app.modules.training_center import *
-from app.modules.category import *
+from app.contrib.dependencies import (
+    AthleteRepositoryDependency,
+    CategoryRepositoryDependency,
+    TrainingCenterRepositoryDependency,
+)
+from app.modules.training_center.schemas import TrainingCenterFilter
+from app.modules.category.schemas import CategoryFilter
 from typing import Annotated
-from .schemas import *
-from .models import *
-from .repository import *
+from .schemas import AthleteInput, AthleteOutput, AthleteUpdate, AthleteFilter
+from .models import AthleteModel
+from .repository import AthleteRepository
 from app.core.databases import get_async_session
 from app.core.repository import Page
+from app.contrib.schemas import BatchGetInput, BatchGetOutput, build_batch_get_output
+from app.core.settings import settings
+from app.core.changes import change_feed
 
 
 
@@ -23,13 +33,12 @@ router = APIRouter()
 
 async def _get_athlete(
     athlete_id: UUID,
-    athlete_repository: AthleteRepositoryDependency = Depends(),
+    athlete_repository: AthleteRepository,
 ):
     """
     Retorna um atleta pelo ID
     """
-    athlete_filter = AthleteFilter(id=athlete_id)
-    db_athlete = await athlete_repository.find_one(filter_in=athlete_filter)
+    db_athlete = await athlete_repository.get_output(athlete_id)
     if db_athlete is None:
         raise HTTPException(status_code=404, detail="Não foi possível encontrar o atleta")
     return db_athlete
@@ -43,7 +52,11 @@ async def get_all_athletes_router(*,
     """
     Retorna todos os Atletas
     """
-    db_athletes = await athlete_repository.paginate(filter_in=athlete_filter,page=athlete_filter.page, size=athlete_filter.size)
+    if settings.ATHLETE_READ_MODEL_ENABLED:
+        return await athlete_repository.paginate_read_model(
+            filter_in=athlete_filter, page=athlete_filter.page, size=athlete_filter.size
+        )
+    db_athletes = await athlete_repository.paginate_output(filter_in=athlete_filter,page=athlete_filter.page, size=athlete_filter.size)
     return db_athletes
 
 
@@ -76,7 +89,13 @@ async def create_athlete_router(
         category_id=db_category.pk_id,
     )
     try:
-        db_athlete = await athlete_repository.create(obj_in=db_athlete, async_session=async_session)
+        if settings.GROUP_COMMIT_ENABLED:
+            # Devolve ao pool a conexão das buscas acima: o lote usa uma conexão própria e,
+            # com a sessão da requisição aberta, criações concorrentes esgotariam o pool
+            await async_session.close()
+            db_athlete = await athlete_repository.create_grouped(obj_in=db_athlete)
+        else:
+            db_athlete = await athlete_repository.create(obj_in=db_athlete, async_session=async_session)
         db_athlete.training_center = db_training_center
         db_athlete.category = db_category
     except exc.IntegrityError as e:
@@ -84,12 +103,54 @@ async def create_athlete_router(
     return db_athlete
 
 
+@router.post("/batch-get", response_model=BatchGetOutput[AthleteOutput])
+async def batch_get_athletes_router(
+    batch_in: BatchGetInput,
+    athlete_repository: AthleteRepositoryDependency,
+):
+    """
+    Retorna vários atletas pelos IDs, na ordem recebida
+    """
+    db_athletes = await athlete_repository.get_many(batch_in.ids)
+    return build_batch_get_output(batch_in.ids, db_athletes)
+
+
+@router.get("/changes")
+async def athlete_changes_router(request: Request):
+    """
+    Stream (Server-Sent Events) com as mudanças nos atletas
+    """
+    if not settings.CHANGES_ENABLED:
+        raise HTTPException(status_code=404, detail="O feed de mudanças não está habilitado")
+    subscription = await change_feed.subscribe(tables=[AthleteModel.__tablename__])
+
+    async def _stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    change = await asyncio.wait_for(subscription.get(), settings.CHANGES_HEARTBEAT_SECONDS)
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if change is None:
+                    # Cliente lento: o buffer encheu e a assinatura foi descartada
+                    break
+                yield f"event: {change['action']}\ndata: {json.dumps(change)}\n\n"
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    return StreamingResponse(_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @router.get("/{athlete_id}", response_model=AthleteOutput)
-async def get_athlete_router(athlete_id: UUID):
+async def get_athlete_router(
+    athlete_id: UUID,
+    athlete_repository: AthleteRepositoryDependency,
+):
     """
     Retorna uma categoria pelo ID
     """
-    return await _get_athlete(athlete_id)
+    return await _get_athlete(athlete_id, athlete_repository)
 
 
 @router.patch("/{athlete_id}", response_model=AthleteOutput)
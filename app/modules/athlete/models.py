@@ -16,15 +16,22 @@ __all__ = ["AthleteModel"]
 
 class AthleteModel(ModelBase):
     __tablename__ = "athletes"
+    # Com a tabela particionada (make partition-athletes), UNIQUE precisa incluir a chave de
+    # partição: a unicidade global de `id` e `document_number` passa a ser garantida pelas
+    # tabelas `athlete_ids` e `athlete_document_numbers`, mantidas por trigger, ao custo de
+    # uma escrita extra em cada uma por INSERT.
+    __table_args__ = (
+        sa.Index("ix_athletes_gender_age", "gender", "age"),
+    )
     pk_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
-    name: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    name: Mapped[str] = mapped_column(sa.String(50), nullable=False, index=True)
     document_number: Mapped[str] = mapped_column(sa.String(11), unique=True, nullable=False)
     age: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     weight: Mapped[float] = mapped_column(sa.Float, nullable=False)
     height: Mapped[float] = mapped_column(sa.Float, nullable=False)
     gender: Mapped[str] = mapped_column(sa.String(1), nullable=False)
     created_at: Mapped[datetime] = mapped_column(sa.DateTime, default=sa.func.now())
-    category_id: Mapped[int] = mapped_column(sa.ForeignKey("categories.pk_id"))
+    category_id: Mapped[int] = mapped_column(sa.ForeignKey("categories.pk_id"), index=True)
     category: Mapped["CategoryModel"] = relationship(back_populates="athlete", lazy="selectin")
-    training_center_id: Mapped[int] = mapped_column(sa.ForeignKey("training_centers.pk_id"))
+    training_center_id: Mapped[int] = mapped_column(sa.ForeignKey("training_centers.pk_id"), index=True)
     training_center: Mapped["TrainingCenterModel"] = relationship(back_populates="athlete", lazy="selectin")
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""
+Particionamento opcional de `athletes` por HASH(training_center_id).
+
+Fica fora da cadeia de migrações do Alembic: é uma operação de infraestrutura
+executada sob demanda, depois de `make run-migrations`, com
+`make partition-athletes n=N` (e desfeita com `make unpartition-athletes`).
+As duas operações verificam o estado atual da tabela e podem ser repetidas.
+
+A cópia dos dados é feita online: um trigger espelha as escritas na tabela nova
+enquanto os lotes são copiados, e apenas a troca final de nomes bloqueia a tabela.
+
+Como restrições UNIQUE em tabelas particionadas precisam incluir a chave de
+partição, a unicidade global do CPF e do id público passa a ser garantida pelas
+tabelas `athlete_document_numbers` e `athlete_ids`, mantidas por trigger. O custo
+é uma escrita extra em cada tabela auxiliar por INSERT (e por UPDATE das colunas).
+Migrações futuras que alterem `athletes` precisam considerar as duas formas da tabela.
+"""
+import argparse
+import asyncio
+from collections.abc import Callable
+
+import sqlalchemy as sa
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.engine import Connection
+
+from app.core.databases import dispose_async_engine, get_async_engine
+
+__all__ = ["partition_athletes", "unpartition_athletes", "is_partitioned"]
+
+BATCH_SIZE = 5000
+
+# Índices da tabela nova (nome temporário -> nome final após a troca)
+INDEXES = {
+    "ix_athletes_partitioned_id": ("ix_athletes_id", "id"),
+    "ix_athletes_partitioned_category_id": ("ix_athletes_category_id", "category_id"),
+    "ix_athletes_partitioned_training_center_id": ("ix_athletes_training_center_id", "training_center_id"),
+    "ix_athletes_partitioned_gender_age": ("ix_athletes_gender_age", "gender, age"),
+    "ix_athletes_partitioned_name": ("ix_athletes_name", "name"),
+}
+
+
+def is_partitioned(op: Operations) -> bool:
+    return op.get_bind().execute(
+        sa.text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'athletes'::regclass)")
+    ).scalar_one()
+
+
+def _create_partitioned_table(op: Operations, partitions: int) -> None:
+    op.execute("CREATE TABLE athletes_partitioned (LIKE athletes INCLUDING DEFAULTS) PARTITION BY HASH (training_center_id)")
+    op.execute("ALTER TABLE athletes_partitioned ADD CONSTRAINT athletes_partitioned_pkey PRIMARY KEY (pk_id, training_center_id)")
+    op.execute(
+        "ALTER TABLE athletes_partitioned ADD CONSTRAINT athletes_partitioned_category_id_fkey "
+        "FOREIGN KEY (category_id) REFERENCES categories (pk_id)"
+    )
+    op.execute(
+        "ALTER TABLE athletes_partitioned ADD CONSTRAINT athletes_partitioned_training_center_id_fkey "
+        "FOREIGN KEY (training_center_id) REFERENCES training_centers (pk_id)"
+    )
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE athletes_p{remainder} PARTITION OF athletes_partitioned "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+    for index_name, (_, columns) in INDEXES.items():
+        op.execute(f"CREATE INDEX {index_name} ON athletes_partitioned ({columns})")
+
+    # Unicidade global do CPF e do id público
+    op.execute(
+        "CREATE TABLE athlete_document_numbers ("
+        "document_number VARCHAR(11) PRIMARY KEY, athlete_pk_id INTEGER NOT NULL)"
+    )
+    op.execute("CREATE TABLE athlete_ids (id UUID PRIMARY KEY, athlete_pk_id INTEGER NOT NULL)")
+    for table, column in (("athlete_document_numbers", "document_number"), ("athlete_ids", "id")):
+        op.execute(f"""
+            CREATE FUNCTION {table}_sync() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    DELETE FROM {table} WHERE {column} = OLD.{column};
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO {table} ({column}, athlete_pk_id) VALUES (NEW.{column}, NEW.pk_id);
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(
+            f"CREATE TRIGGER {table}_sync "
+            f"AFTER INSERT OR UPDATE OF {column} OR DELETE ON athletes_partitioned "
+            f"FOR EACH ROW EXECUTE FUNCTION {table}_sync()"
+        )
+
+
+def _install_mirror_trigger(op: Operations) -> None:
+    """Espelha na tabela nova as escritas feitas em `athletes` durante a cópia."""
+    op.execute("""
+        CREATE FUNCTION athletes_partitioned_mirror() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM athletes_partitioned WHERE pk_id = OLD.pk_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO athletes_partitioned SELECT (NEW).*;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER athletes_partitioned_mirror AFTER INSERT OR UPDATE OR DELETE ON athletes "
+        "FOR EACH ROW EXECUTE FUNCTION athletes_partitioned_mirror()"
+    )
+
+
+def _copy_batches(op: Operations) -> int:
+    """
+    Copia as linhas existentes em lotes de `BATCH_SIZE`.
+
+    Cada lote é um bloco DO (uma transação) que segura o lock SHARE apenas
+    durante o lote: leituras continuam livres e escritas esperam alguns
+    milissegundos, evitando corrida com o trigger de espelhamento.
+    """
+    bind = op.get_bind()
+    max_pk_id = bind.execute(sa.text("SELECT coalesce(max(pk_id), 0) FROM athletes")).scalar_one()
+    for start in range(0, max_pk_id, BATCH_SIZE):
+        op.execute(f"""
+            DO $$
+            BEGIN
+                LOCK TABLE athletes IN SHARE MODE;
+                INSERT INTO athletes_partitioned
+                SELECT a.* FROM athletes a
+                WHERE a.pk_id > {start} AND a.pk_id <= {start + BATCH_SIZE}
+                  AND NOT EXISTS (SELECT 1 FROM athletes_partitioned p WHERE p.pk_id = a.pk_id);
+            END
+            $$
+        """)
+    return max_pk_id
+
+
+def _swap_tables(op: Operations, copied_up_to: int) -> None:
+    renames = "\n".join(
+        f"ALTER INDEX {index_name} RENAME TO {final_name};"
+        for index_name, (final_name, _) in INDEXES.items()
+    )
+    op.execute(f"""
+        DO $$
+        BEGIN
+            LOCK TABLE athletes IN ACCESS EXCLUSIVE MODE;
+            INSERT INTO athletes_partitioned
+            SELECT a.* FROM athletes a
+            WHERE a.pk_id > {copied_up_to}
+              AND NOT EXISTS (SELECT 1 FROM athletes_partitioned p WHERE p.pk_id = a.pk_id);
+            DROP TRIGGER athletes_partitioned_mirror ON athletes;
+            ALTER SEQUENCE athletes_pk_id_seq OWNED BY athletes_partitioned.pk_id;
+            DROP TABLE athletes;
+            ALTER TABLE athletes_partitioned RENAME TO athletes;
+            ALTER TABLE athletes RENAME CONSTRAINT athletes_partitioned_pkey TO athletes_pkey;
+            ALTER TABLE athletes RENAME CONSTRAINT athletes_partitioned_category_id_fkey TO athletes_category_id_fkey;
+            ALTER TABLE athletes RENAME CONSTRAINT athletes_partitioned_training_center_id_fkey TO athletes_training_center_id_fkey;
+            {renames}
+        END
+        $$
+    """)
+    op.execute("DROP FUNCTION athletes_partitioned_mirror()")
+
+
+def _partition(op: Operations, partitions: int) -> bool:
+    # Roda em autocommit: cada passo (e cada lote da cópia) é uma transação própria
+    if is_partitioned(op):
+        return False
+    _create_partitioned_table(op, partitions)
+    _install_mirror_trigger(op)
+    copied_up_to = _copy_batches(op)
+    _swap_tables(op, copied_up_to)
+    return True
+
+
+def _unpartition(op: Operations) -> bool:
+    if not is_partitioned(op):
+        return False
+    # Volta para a tabela simples em uma única transação (a tabela fica bloqueada durante a cópia)
+    op.execute("LOCK TABLE athletes IN ACCESS EXCLUSIVE MODE")
+    op.execute("CREATE TABLE athletes_unpartitioned (LIKE athletes INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO athletes_unpartitioned SELECT * FROM athletes")
+    op.execute("ALTER SEQUENCE athletes_pk_id_seq OWNED BY athletes_unpartitioned.pk_id")
+    op.execute("DROP TABLE athletes")
+    for table in ("athlete_document_numbers", "athlete_ids"):
+        op.execute(f"DROP TABLE {table}")
+        op.execute(f"DROP FUNCTION {table}_sync()")
+    op.rename_table("athletes_unpartitioned", "athletes")
+    op.create_primary_key("athletes_pkey", "athletes", ["pk_id"])
+    op.create_unique_constraint("athletes_document_number_key", "athletes", ["document_number"])
+    op.create_foreign_key("athletes_category_id_fkey", "athletes", "categories", ["category_id"], ["pk_id"])
+    op.create_foreign_key(
+        "athletes_training_center_id_fkey", "athletes", "training_centers", ["training_center_id"], ["pk_id"]
+    )
+    op.create_index("ix_athletes_id", "athletes", ["id"], unique=True)
+    op.create_index("ix_athletes_category_id", "athletes", ["category_id"])
+    op.create_index("ix_athletes_training_center_id", "athletes", ["training_center_id"])
+    op.create_index("ix_athletes_gender_age", "athletes", ["gender", "age"])
+    op.create_index("ix_athletes_name", "athletes", ["name"])
+    return True
+
+
+async def _run(operation: Callable[[Operations], bool], *, autocommit: bool = False) -> bool:
+    engine = get_async_engine()
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("O particionamento de atletas só é suportado no PostgreSQL")
+
+    def run(connection: Connection) -> bool:
+        changed = operation(Operations(MigrationContext.configure(connection)))
+        connection.commit()
+        return changed
+
+    async with engine.connect() as connection:
+        if autocommit:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+        return await connection.run_sync(run)
+
+
+async def partition_athletes(partitions: int) -> bool:
+    """Particiona `athletes` em `partitions` partições. Retorna False se já estiver particionada."""
+    if partitions < 2:
+        raise ValueError("São necessárias ao menos 2 partições")
+    return await _run(lambda op: _partition(op, partitions), autocommit=True)
+
+
+async def unpartition_athletes() -> bool:
+    """Volta `athletes` para uma tabela simples. Retorna False se ela não estiver particionada."""
+    return await _run(_unpartition)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Particiona (ou desfaz o particionamento de) athletes.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--partitions", type=int, help="quantidade de partições HASH(training_center_id)")
+    group.add_argument("--undo", action="store_true", help="volta para a tabela simples")
+    args = parser.parse_args()
+
+    try:
+        if args.undo:
+            changed = await unpartition_athletes()
+            print("athletes voltou a ser uma tabela simples" if changed else "athletes não está particionada")
+        else:
+            changed = await partition_athletes(args.partitions)
+            print(f"athletes particionada em {args.partitions}" if changed else "athletes já está particionada")
+    finally:
+        await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
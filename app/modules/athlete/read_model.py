@@ -0,0 +1,206 @@
+from __future__ import annotations
+import functools
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.contrib import ModelBase
+from app.core.databases import get_async_context_session
+from app.core.repository import ChangeHook, register_change_hook
+from app.core.settings import settings
+from app.modules.category.models import CategoryModel
+from app.modules.training_center.models import TrainingCenterModel
+from .models import AthleteModel
+
+__all__ = [
+    "AthleteReadModel",
+    "to_athlete_output",
+    "find_read_model_drift",
+    "rebuild_read_model",
+    "check_read_model",
+]
+
+# Colunas mostradas na listagem de atletas (AthleteOutput); entram no índice de cobertura
+LIST_COLUMNS = [
+    "category_id", "category_name", "category_created_at",
+    "training_center_id", "training_center_name", "training_center_address",
+    "training_center_owner", "training_center_created_at",
+]
+
+
+class AthleteReadModel(ModelBase):
+    """
+    Projeção desnormalizada de atletas para a listagem (GET /athletes/).
+
+    Guarda os campos da listagem já com categoria e centro de treinamento,
+    além dos campos filtráveis do AthleteFilter. É mantida em sincronia pelos
+    hooks de escrita do RepositoryBase, na mesma transação da escrita, quando
+    ATHLETE_READ_MODEL_ENABLED ou ATHLETE_READ_MODEL_SYNC_ENABLED está ligado.
+    """
+
+    __tablename__ = "athlete_read_model"
+    __table_args__ = (
+        sa.Index("ix_athlete_read_model_name", "name", postgresql_include=LIST_COLUMNS),
+        # Filtro por centro da listagem (o UUID é resolvido para o pk_id) já na ordem da página
+        sa.Index("ix_athlete_read_model_training_center_pk_id", "training_center_pk_id", "athlete_pk_id"),
+        sa.Index("ix_athlete_read_model_gender_age", "gender", "age"),
+        # Usado pela propagação de alterações de categoria (_sync_category)
+        sa.Index("ix_athlete_read_model_category_pk_id", "category_pk_id"),
+    )
+    athlete_pk_id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    document_number: Mapped[str] = mapped_column(sa.String(11), nullable=False)
+    age: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    weight: Mapped[float] = mapped_column(sa.Float, nullable=False)
+    height: Mapped[float] = mapped_column(sa.Float, nullable=False)
+    gender: Mapped[str] = mapped_column(sa.String(1), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(sa.DateTime, nullable=False)
+    category_pk_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    category_id: Mapped[UUID] = mapped_column(sa.UUID(as_uuid=True), nullable=False)
+    category_name: Mapped[str] = mapped_column(sa.String(20), nullable=False)
+    category_created_at: Mapped[datetime] = mapped_column(sa.DateTime, nullable=False)
+    training_center_pk_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    training_center_id: Mapped[UUID] = mapped_column(sa.UUID(as_uuid=True), nullable=False)
+    training_center_name: Mapped[str] = mapped_column(sa.String(20), nullable=False)
+    training_center_address: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    training_center_owner: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    training_center_created_at: Mapped[datetime] = mapped_column(sa.DateTime, nullable=False)
+
+
+def _projection() -> sa.Select[Any]:
+    """Query que monta as linhas do read model a partir das tabelas normalizadas."""
+    return (
+        sa.select(
+            AthleteModel.pk_id.label("athlete_pk_id"),
+            AthleteModel.id,
+            AthleteModel.name,
+            AthleteModel.document_number,
+            AthleteModel.age,
+            AthleteModel.weight,
+            AthleteModel.height,
+            AthleteModel.gender,
+            AthleteModel.created_at,
+            CategoryModel.pk_id.label("category_pk_id"),
+            CategoryModel.id.label("category_id"),
+            CategoryModel.name.label("category_name"),
+            CategoryModel.created_at.label("category_created_at"),
+            TrainingCenterModel.pk_id.label("training_center_pk_id"),
+            TrainingCenterModel.id.label("training_center_id"),
+            TrainingCenterModel.name.label("training_center_name"),
+            TrainingCenterModel.address.label("training_center_address"),
+            TrainingCenterModel.owner.label("training_center_owner"),
+            TrainingCenterModel.created_at.label("training_center_created_at"),
+        )
+        .join(CategoryModel, CategoryModel.pk_id == AthleteModel.category_id)
+        .join(TrainingCenterModel, TrainingCenterModel.pk_id == AthleteModel.training_center_id)
+    )
+
+
+def _read_model_columns() -> list[sa.ColumnElement[Any]]:
+    return [AthleteReadModel.__table__.c[column.name] for column in _projection().selected_columns]
+
+
+def to_athlete_output(row: AthleteReadModel) -> dict[str, Any]:
+    """Converte uma linha do read model no formato do AthleteOutput."""
+    return {
+        "name": row.name,
+        "category": {
+            "id": row.category_id,
+            "created_at": row.category_created_at,
+            "name": row.category_name,
+        },
+        "training_center": {
+            "id": row.training_center_id,
+            "created_at": row.training_center_created_at,
+            "name": row.training_center_name,
+            "address": row.training_center_address,
+            "owner": row.training_center_owner,
+        },
+    }
+
+
+def _when_maintained(hook: ChangeHook) -> ChangeHook:
+    """Só executa o hook se a projeção estiver sendo mantida (ver Settings)."""
+
+    @functools.wraps(hook)
+    async def wrapper(db_session: AsyncSession, action: str, db_obj: Any) -> None:
+        if settings.ATHLETE_READ_MODEL_ENABLED or settings.ATHLETE_READ_MODEL_SYNC_ENABLED:
+            await hook(db_session, action, db_obj)
+
+    return wrapper
+
+
+async def _sync_athlete(db_session: AsyncSession, action: str, athlete: AthleteModel) -> None:
+    await db_session.execute(sa.delete(AthleteReadModel).where(AthleteReadModel.athlete_pk_id == athlete.pk_id))
+    if action != "delete":
+        projection = _projection().where(AthleteModel.pk_id == athlete.pk_id)
+        await db_session.execute(sa.insert(AthleteReadModel).from_select(_read_model_columns(), projection))
+
+
+# Os hooks de update de categoria e centro copiam só as colunas alteráveis: `id` e
+# `created_at` não mudam, e regravar `created_at` pelo Python muda a representação
+# guardada no SQLite (com microssegundos), acusando divergência no verificador.
+async def _sync_category(db_session: AsyncSession, action: str, category: CategoryModel) -> None:
+    if action != "update":
+        return
+    await db_session.execute(
+        sa.update(AthleteReadModel)
+        .where(AthleteReadModel.category_pk_id == category.pk_id)
+        .values(category_name=category.name)
+    )
+
+
+async def _sync_training_center(db_session: AsyncSession, action: str, training_center: TrainingCenterModel) -> None:
+    if action != "update":
+        return
+    await db_session.execute(
+        sa.update(AthleteReadModel)
+        .where(AthleteReadModel.training_center_pk_id == training_center.pk_id)
+        .values(
+            training_center_name=training_center.name,
+            training_center_address=training_center.address,
+            training_center_owner=training_center.owner,
+        )
+    )
+
+
+register_change_hook(AthleteModel, _when_maintained(_sync_athlete))
+register_change_hook(CategoryModel, _when_maintained(_sync_category))
+register_change_hook(TrainingCenterModel, _when_maintained(_sync_training_center))
+
+
+async def find_read_model_drift(db_session: AsyncSession) -> list[int]:
+    """
+    Verificador de consistência: compara o read model com as tabelas normalizadas.
+
+    Retorna os `pk_id` dos atletas cuja linha está ausente, sobrando ou diferente.
+    """
+    projection = _projection()
+    read_model = sa.select(*_read_model_columns())
+    missing_or_stale = projection.except_(read_model).subquery()
+    orphaned = read_model.except_(projection).subquery()
+    statement = sa.union(
+        sa.select(missing_or_stale.c.athlete_pk_id),
+        sa.select(orphaned.c.athlete_pk_id),
+    )
+    return sorted((await db_session.execute(statement)).scalars().all())
+
+
+async def rebuild_read_model(db_session: AsyncSession) -> None:
+    """Recria todo o read model a partir das tabelas normalizadas."""
+    await db_session.execute(sa.delete(AthleteReadModel))
+    await db_session.execute(sa.insert(AthleteReadModel).from_select(_read_model_columns(), _projection()))
+    await db_session.commit()
+
+
+async def check_read_model(*, rebuild: bool = False) -> list[int]:
+    """Procura divergências no read model e, opcionalmente, o recria."""
+    async with get_async_context_session() as db_session:
+        drift = await find_read_model_drift(db_session)
+        if drift and rebuild:
+            await rebuild_read_model(db_session)
+    return drift
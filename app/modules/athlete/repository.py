@@ -1,11 +1,187 @@
-from app.core.repository import RepositoryBase, AsyncSessionCallable
+import math
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.contrib import uuid7
+from app.core.coalescing import coalesced
+from app.core.databases import get_async_context_session
+from app.core.fast_reader import fast_reader
+from app.core.repository import RepositoryBase, AsyncSessionCallable, Page
+from app.core.settings import settings
+from app.core.warmup import register_warm_up_queries
+from app.modules.training_center.models import TrainingCenterModel
 from .models import AthleteModel
-from .schemas import *
+from .read_model import AthleteReadModel, to_athlete_output
+from .schemas import AthleteInput, AthleteUpdate, AthleteFilter
 
 __all__ = [
     "AthleteRepository"
 ]
 
+# SQL da leitura rápida (FastReader). Os nomes das colunas seguem o AthleteOutput.
+_FAST_COLUMNS = """
+    a.name,
+    c.id AS category_id, c.created_at AS category_created_at, c.name AS category_name,
+    t.id AS training_center_id, t.created_at AS training_center_created_at, t.name AS training_center_name,
+    t.address AS training_center_address, t.owner AS training_center_owner
+"""
+_FAST_FROM = """
+    FROM athletes a
+    JOIN categories c ON c.pk_id = a.category_id
+    JOIN training_centers t ON t.pk_id = a.training_center_id
+"""
+_FAST_GET_SQL = f"SELECT {_FAST_COLUMNS} {_FAST_FROM} WHERE a.id = $1 LIMIT 1"
+
+# Condição SQL de cada campo do AthleteFilter ({} recebe o número do parâmetro)
+_FAST_FILTERS = {
+    "id": "a.id = ${}",
+    "document_number": "a.document_number = ${}",
+    "name": "a.name = ${}",
+    "age": "a.age = ${}",
+    "weight": "a.weight = ${}",
+    "height": "a.height = ${}",
+    "gender": "a.gender = ${}",
+    "training_center_id": "a.training_center_id = (SELECT pk_id FROM training_centers WHERE id = ${})",
+}
+
+
+def _record_to_output(record: Any) -> dict[str, Any]:
+    """Monta o dict no formato do AthleteOutput a partir de um registro do asyncpg."""
+    return {
+        "name": record["name"],
+        "category": {
+            "id": record["category_id"],
+            "created_at": record["category_created_at"],
+            "name": record["category_name"],
+        },
+        "training_center": {
+            "id": record["training_center_id"],
+            "created_at": record["training_center_created_at"],
+            "name": record["training_center_name"],
+            "address": record["training_center_address"],
+            "owner": record["training_center_owner"],
+        },
+    }
+
+
 class AthleteRepository(RepositoryBase[AthleteModel, AthleteInput, AthleteUpdate, AthleteFilter]):
     def __init__(self, *,session_callable: AsyncSessionCallable | None = None):
         super().__init__(AthleteModel, AthleteInput, AthleteUpdate, AthleteFilter, session_callable=session_callable)
+        # O filtro recebe o UUID público do centro; a comparação é feita na FK inteira via
+        # subquery escalar, o que permite o pruning de partições quando `athletes` é particionada.
+        self.filter_resolvers["training_center_id"] = lambda value: AthleteModel.training_center_id == (
+            select(TrainingCenterModel.pk_id).where(TrainingCenterModel.id == value).scalar_subquery()
+        )
+
+    @coalesced
+    async def paginate_read_model(
+        self,
+        *,
+        filter_in: AthleteFilter,
+        page: int = 1,
+        size: int = 20,
+        async_session: AsyncSession | None = None,
+    ) -> Page[dict]:
+        """
+        Lista atletas a partir do read model desnormalizado (`athlete_read_model`).
+
+        Retorna os itens já no formato do AthleteOutput, sem joins nem carregamento
+        de relacionamentos.
+        """
+        db_session = await self._get_session(async_session)
+        query = select(AthleteReadModel)
+        for field_name, value in filter_in.model_dump(exclude_none=True, by_alias=True).items():
+            if field_name == "training_center_id":
+                # Como no ORM: o UUID vira o pk_id do centro, coberto pelo índice
+                # (training_center_pk_id, athlete_pk_id), que já entrega a página ordenada
+                query = query.where(AthleteReadModel.training_center_pk_id == (
+                    select(TrainingCenterModel.pk_id).where(TrainingCenterModel.id == value).scalar_subquery()
+                ))
+            else:
+                query = query.where(getattr(AthleteReadModel, field_name) == value)
+
+        count_query = select(func.count()).select_from(query.subquery())
+        total_items = (await self._execute(db_session, count_query, origin="paginate_read_model")).scalar_one()
+
+        paginated_query = query.order_by(AthleteReadModel.athlete_pk_id).offset((page - 1) * size).limit(size)
+        rows = (await self._execute(db_session, paginated_query, origin="paginate_read_model")).scalars().all()
+
+        return Page(
+            items=[to_athlete_output(row) for row in rows],
+            total=total_items,
+            page=page,
+            size=size,
+            pages=math.ceil(total_items / size) if size > 0 else 0,
+        )
+
+    async def get_output(self, id: UUID) -> AthleteModel | dict[str, Any] | None:
+        """
+        Busca um atleta pelo ID no formato do AthleteOutput.
+
+        Usa o FastReader quando disponível e o ORM (`find_one`) caso contrário.
+        """
+        if not fast_reader.available():
+            return await self.find_one(filter_in=AthleteFilter(id=id))
+        record = await fast_reader.fetchrow(_FAST_GET_SQL, id)
+        return _record_to_output(record) if record is not None else None
+
+    async def paginate_output(
+        self, *, filter_in: AthleteFilter, page: int = 1, size: int = 20
+    ) -> Page[AthleteModel] | Page[dict[str, Any]]:
+        """
+        Lista atletas com paginação no formato do AthleteOutput.
+
+        Usa o FastReader quando disponível e o ORM (`paginate`) caso contrário.
+        Com o FastReader, contagem e página vêm em uma única ida ao banco. Os dois
+        caminhos ordenam por `pk_id` (como o read model), para que as páginas sejam
+        estáveis e iguais entre si.
+        """
+        if not fast_reader.available():
+            return await self.paginate(filter_in=filter_in, sort_by={"pk_id": 1}, page=page, size=size)
+
+        conditions, args = [], []
+        for key, value in filter_in.model_dump(exclude_none=True, by_alias=True).items():
+            args.append(value)
+            conditions.append(_FAST_FILTERS[key].format(len(args)))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        args += [size, (page - 1) * size]
+        # A linha da contagem sempre existe; sem itens na página, as colunas vêm nulas
+        sql = f"""
+            SELECT total.count AS total, items.*
+            FROM (SELECT count(*) FROM athletes a {where}) total
+            LEFT JOIN LATERAL (
+                SELECT {_FAST_COLUMNS} {_FAST_FROM} {where}
+                ORDER BY a.pk_id LIMIT ${len(args) - 1} OFFSET ${len(args)}
+            ) items ON true
+        """
+        records = await fast_reader.fetch(sql, *args)
+        total_items = records[0]["total"]
+        return Page(
+            items=[_record_to_output(record) for record in records if record["name"] is not None],
+            total=total_items,
+            page=page,
+            size=size,
+            pages=math.ceil(total_items / size) if size > 0 else 0,
+        )
+
+
+async def _warm_up_queries() -> None:
+    # Um id inexistente gera as mesmas queries das rotas sem depender dos dados
+    repository, missing_id = AthleteRepository(), uuid7()
+    async with get_async_context_session() as db_session:
+        await repository.find_one(filter_in=AthleteFilter(id=missing_id), async_session=db_session)
+        for filter_in in (AthleteFilter(), AthleteFilter(training_center_id=missing_id)):
+            await repository.paginate(filter_in=filter_in, sort_by={"pk_id": 1}, async_session=db_session)
+            if settings.ATHLETE_READ_MODEL_ENABLED:
+                await repository.paginate_read_model(filter_in=filter_in, async_session=db_session)
+        await repository.get_many([missing_id], async_session=db_session)
+    # Só depois de devolver a conexão da sessão: o FastReader pega outra do pool
+    if fast_reader.available():
+        await repository.get_output(missing_id)
+        await repository.paginate_output(filter_in=AthleteFilter())
+        await repository.paginate_output(filter_in=AthleteFilter(training_center_id=missing_id))
+
+
+register_warm_up_queries(_warm_up_queries)
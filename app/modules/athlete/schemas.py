@@ -1,9 +1,9 @@
 from uuid import UUID
 from pydantic import Field
 from typing import Literal
-from app.modules.category import CategoryOutput
+from app.modules.category.schemas import CategoryOutput
 from app.contrib import SchemaBase
-from app.modules.training_center import TrainingCenterOutput
+from app.modules.training_center.schemas import TrainingCenterOutput
 
 __all__ = ["AthleteInput", "AthleteOutput", "AthleteUpdate", "AthleteFilter", "ListAthleteOutput"]
 
@@ -60,6 +60,7 @@ class AthleteFilter(SchemaBase):
     weight: int | None = None
     height: float | None = None
     gender: str | None = None
+    training_center_id: UUID | None = None
     page: int = Field(default=1, exclude=True)
     size: int = Field(default=20, exclude=True)
 
@@ -1,3 +1,4 @@
-from .models import *
-from .schemas import *
-from .controller import *
\ No newline at end of file
+from .models import CategoryModel
+from .schemas import CategoryInput, CategoryOutput, CategoryFilter, ListCategoryOutput
+
+__all__ = ["CategoryModel", "CategoryInput", "CategoryOutput", "CategoryFilter", "ListCategoryOutput"]
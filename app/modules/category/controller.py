@@ -5,6 +5,7 @@ from sqlalchemy import exc
 from uuid import UUID
 from typing import Annotated
 from app.core.databases import get_async_context_session
+from app.contrib.schemas import BatchGetInput, BatchGetOutput, build_batch_get_output
 
 __all__ = ["router"]
 
@@ -35,6 +36,15 @@ async def create_category_router(category: CategoryInput):
     return db_category
 
 
+@router.post("/batch-get", response_model=BatchGetOutput[CategoryOutput])
+async def batch_get_categories_router(batch_in: BatchGetInput):
+    """
+    Retorna várias categorias pelos IDs, na ordem recebida
+    """
+    db_categories = await category_repository.get_many(batch_in.ids)
+    return build_batch_get_output(batch_in.ids, db_categories)
+
+
 @router.get("/{category_id}", response_model=CategoryOutput)
 async def get_category_router(category_id: UUID):
     """
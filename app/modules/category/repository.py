@@ -1,6 +1,9 @@
+from app.contrib import uuid7
+from app.core.databases import get_async_context_session
 from app.core.repository import RepositoryBase, AsyncSessionCallable
+from app.core.warmup import register_warm_up_queries
 from .models import CategoryModel
-from .schemas import *
+from .schemas import CategoryInput, CategoryOutput, CategoryFilter
 
 __all__ = [
     "CategoryRepository"
@@ -9,3 +12,15 @@ __all__ = [
 class CategoryRepository(RepositoryBase[CategoryModel, CategoryInput, CategoryOutput, CategoryFilter]):
     def __init__(self, *,session_callable: AsyncSessionCallable | None = None):
         super().__init__(CategoryModel, CategoryInput, CategoryOutput, CategoryFilter, session_callable=session_callable)
+
+
+async def _warm_up_queries() -> None:
+    # Um id inexistente gera as mesmas queries das rotas sem depender dos dados
+    repository, missing_id = CategoryRepository(), uuid7()
+    async with get_async_context_session() as db_session:
+        await repository.find_one(filter_in=CategoryFilter(id=[missing_id]), async_session=db_session)
+        await repository.find_all(filter_in=CategoryFilter(), async_session=db_session)
+        await repository.get_many([missing_id], async_session=db_session)
+
+
+register_warm_up_queries(_warm_up_queries)
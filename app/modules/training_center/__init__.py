@@ -1,3 +1,10 @@
-from .models import *
-from .schemas import *
-from .controller import *
\ No newline at end of file
+from .models import TrainingCenterModel
+from .schemas import TrainingCenterInput, TrainingCenterOutput, TrainingCenterFilter, ListTrainingCenterOutput
+
+__all__ = [
+    "TrainingCenterModel",
+    "TrainingCenterInput",
+    "TrainingCenterOutput",
+    "TrainingCenterFilter",
+    "ListTrainingCenterOutput",
+]
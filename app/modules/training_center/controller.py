@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, Query
-from .schemas import *
-from .repository import *
-from .models import *
+from .schemas import TrainingCenterInput, TrainingCenterOutput, TrainingCenterFilter, ListTrainingCenterOutput
+from .repository import TrainingCenterRepository
 from app.core.databases import get_async_context_session
+from app.contrib.schemas import BatchGetInput, BatchGetOutput, build_batch_get_output
 from uuid import UUID
 from typing import Annotated
 
@@ -36,6 +36,15 @@ async def create_training_center_router(
     return db_training_center
 
 
+@router.post("/batch-get", response_model=BatchGetOutput[TrainingCenterOutput])
+async def batch_get_training_centers_router(batch_in: BatchGetInput):
+    """
+    Retorna vários centros de treinamento pelos IDs, na ordem recebida.
+    """
+    db_training_centers = await training_center_repository.get_many(batch_in.ids)
+    return build_batch_get_output(batch_in.ids, db_training_centers)
+
+
 @router.get("/{training_center_id}", response_model=TrainingCenterOutput)
 async def get_training_center_router(
     training_center_id: UUID,
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
-from app.modules import athlete, category, training_center
+from app.modules.athlete import controller as athlete
+from app.modules.category import controller as category
+from app.modules.training_center import controller as training_center
+from app.core.deadlines import query_metrics
+from app.core.slow_queries import slow_query_recorder
 
 router = APIRouter()
 
@@ -10,3 +14,14 @@ router.include_router(training_center.router, prefix="/training-centers", tags=[
 @router.get("/")
 async def root():
     return {"message": "Hello World"}
+
+
+@router.get("/metrics")
+async def metrics():
+    return {"queries": query_metrics.as_dict()}
+
+
+@router.get("/admin/slow-queries")
+async def slow_queries():
+    """Queries lentas mais recentes (requer SLOW_QUERY_ENABLED)"""
+    return list(reversed(slow_query_recorder.records))
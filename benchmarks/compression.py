@@ -0,0 +1,118 @@
+"""
+Benchmark da compressão de respostas: bytes enviados e CPU por requisição.
+
+Serve uma página da listagem de atletas (Page[AthleteOutput] em JSON, como o
+GET /athletes/) por uma aplicação ASGI mínima envolvida pelo CompressionMiddleware
+e compara, para cada codificação disponível (gzip, e br/zstd se instalados):
+
+- sem compressão (identity);
+- comprimindo toda requisição (cache desligado, como em páginas sempre diferentes);
+- com o cache por ETag (leituras repetidas da mesma página).
+
+Mede o tamanho do corpo enviado e o tempo de CPU do processo (`time.process_time`)
+por requisição. Não usa banco de dados. Exemplo:
+
+    uv run python -m benchmarks.compression --athletes 50
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+from fastapi import FastAPI  # noqa: E402
+from starlette.types import ASGIApp, Message  # noqa: E402
+
+from app.core.compression import CompressionMiddleware, available_encodings  # noqa: E402
+from app.core.repository import Page  # noqa: E402
+from app.modules.athlete.schemas import AthleteOutput  # noqa: E402
+
+WARMUP_REQUESTS = 50
+
+
+def _page(athletes: int) -> dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    centers = [
+        {"id": uuid.uuid4(), "created_at": now, "name": f"CT {index}", "address": f"Rua {index}, {index * 7}",
+         "owner": f"Dono {index}"}
+        for index in range(10)
+    ]
+    category = {"id": uuid.uuid4(), "created_at": now, "name": "Scale"}
+    items = [
+        {"name": f"Atleta {index}", "category": category, "training_center": centers[index % len(centers)]}
+        for index in range(athletes)
+    ]
+    return {"items": items, "total": 10_000, "page": 1, "size": athletes, "pages": 10_000 // athletes}
+
+
+def _app(page: dict[str, Any]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/athletes/", response_model=Page[AthleteOutput])
+    async def athletes():
+        return page
+
+    return app
+
+
+async def _request(app: ASGIApp, accept_encoding: str) -> int:
+    """Faz um GET /athletes/ e retorna o tamanho do corpo enviado."""
+    scope = {
+        "type": "http", "method": "GET", "path": "/athletes/", "raw_path": b"/athletes/", "root_path": "",
+        "query_string": b"", "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "http_version": "1.1", "scheme": "http", "server": ("bench", 80), "client": ("bench", 1234),
+    }
+    sent = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return sent
+
+
+async def _measure(app: ASGIApp, accept_encoding: str, *, requests: int) -> dict[str, float]:
+    for _ in range(WARMUP_REQUESTS):
+        await _request(app, accept_encoding)
+    started = time.process_time()
+    sizes = [await _request(app, accept_encoding) for _ in range(requests)]
+    elapsed = time.process_time() - started
+    return {"bytes": sum(sizes) / requests, "cpu_us": elapsed / requests * 1_000_000}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--athletes", type=int, default=50, help="atletas por página")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = _app(_page(args.athletes))
+    results = {"identity": await _measure(CompressionMiddleware(app), "identity", requests=args.requests)}
+    for encoding in available_encodings():
+        results[f"{encoding} sem cache"] = await _measure(
+            CompressionMiddleware(app, cache_size=0), encoding, requests=args.requests
+        )
+        results[f"{encoding} com cache"] = await _measure(
+            CompressionMiddleware(app), encoding, requests=args.requests
+        )
+
+    identity = results["identity"]
+    print(f"{'codificação':<16} {'bytes/resp':>11} {'razão':>7} {'CPU µs/req':>11} {'CPU extra µs':>13}")
+    for name, result in results.items():
+        print(
+            f"{name:<16} {result['bytes']:>11.0f} {identity['bytes'] / result['bytes']:>6.1f}x "
+            f"{result['cpu_us']:>11.0f} {result['cpu_us'] - identity['cpu_us']:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
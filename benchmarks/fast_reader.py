@@ -0,0 +1,141 @@
+"""
+Benchmark do FastReader: CPU do processo da API por requisição, ORM contra asyncpg direto.
+
+Executa o trabalho de leitura das rotas de detalhe (GET /athletes/{id}) e de
+listagem (GET /athletes/) com FAST_READER_ENABLED desligado e ligado: a consulta
+pelo AthleteRepository e a validação/serialização pelo `response_model` da rota.
+Mede o tempo de CPU do processo (`time.process_time`) e a latência de cada
+requisição; o tempo de CPU do PostgreSQL não entra na conta.
+
+Usa o banco de `DB_URL`, que precisa ser um PostgreSQL de teste: as tabelas são
+recriadas. Exemplo:
+
+    DB_URL=postgresql+asyncpg://workout@localhost/workout_test uv run python -m benchmarks.fast_reader
+"""
+import argparse
+import asyncio
+import functools
+import os
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+from sqlalchemy import make_url, select, text  # noqa: E402
+
+import app.main  # noqa: E402,F401
+from app.contrib import ModelBase  # noqa: E402
+from app.core.databases import dispose_async_engine, get_async_context_session, get_async_engine  # noqa: E402
+from app.core.repository import Page  # noqa: E402
+from app.core.settings import settings  # noqa: E402
+from app.modules.athlete.models import AthleteModel  # noqa: E402
+from app.modules.athlete.repository import AthleteRepository  # noqa: E402
+from app.modules.athlete.schemas import AthleteFilter, AthleteOutput  # noqa: E402
+
+WARMUP_REQUESTS = 50
+
+
+async def _reset_database(*, athletes: int, centers: int) -> list[UUID]:
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(ModelBase.metadata.drop_all)
+        await connection.run_sync(ModelBase.metadata.create_all)
+        await connection.execute(text(
+            "INSERT INTO categories (id, name, created_at) VALUES (gen_random_uuid(), 'Scale', now())"
+        ))
+        await connection.execute(text(
+            "INSERT INTO training_centers (id, name, address, owner, created_at) "
+            "SELECT gen_random_uuid(), 'CT ' || g, 'Rua ' || g, 'Dono ' || g, now() FROM generate_series(1, :centers) g"
+        ), {"centers": centers})
+        await connection.execute(text("""
+            INSERT INTO athletes (
+                id, name, document_number, age, weight, height, gender, created_at, category_id, training_center_id
+            )
+            SELECT
+                gen_random_uuid(), 'Atleta ' || g, lpad(g::text, 11, '0'), 20 + g % 30, 60 + g % 40,
+                1.6 + (g % 30) / 100.0, (ARRAY['M', 'F'])[g % 2 + 1], now(),
+                (SELECT min(pk_id) FROM categories), (SELECT min(pk_id) FROM training_centers) + g % :centers
+            FROM generate_series(1, :athletes) g
+        """), {"athletes": athletes, "centers": centers})
+        ids = (await connection.execute(select(AthleteModel.id))).scalars().all()
+    async with get_async_engine().connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("ANALYZE"))
+    return list(ids)
+
+
+async def _detail(athlete_id: UUID) -> bytes:
+    repository = AthleteRepository()
+    if settings.FAST_READER_ENABLED:
+        db_athlete = await repository.get_output(athlete_id)
+    else:
+        # Sessão explícita, como nas rotas que recebem `get_async_session`
+        async with get_async_context_session() as db_session:
+            db_athlete = await repository.find_one(filter_in=AthleteFilter(id=athlete_id), async_session=db_session)
+    return AthleteOutput.model_validate(db_athlete).model_dump_json().encode()
+
+
+async def _list(page: int) -> bytes:
+    repository = AthleteRepository()
+    if settings.FAST_READER_ENABLED:
+        db_athletes = await repository.paginate_output(filter_in=AthleteFilter(), page=page, size=20)
+    else:
+        async with get_async_context_session() as db_session:
+            db_athletes = await repository.paginate(
+                filter_in=AthleteFilter(), sort_by={"pk_id": 1}, page=page, size=20, async_session=db_session
+            )
+    return Page[AthleteOutput].model_validate(db_athletes).model_dump_json().encode()
+
+
+async def _measure(requests: list[Callable[[], Awaitable[Any]]]) -> dict[str, float]:
+    for request in requests[:WARMUP_REQUESTS]:
+        await request()
+
+    cpu_times: list[float] = []
+    latencies: list[float] = []
+    for request in requests:
+        cpu_started, started = time.process_time(), time.perf_counter()
+        await request()
+        latencies.append(time.perf_counter() - started)
+        cpu_times.append(time.process_time() - cpu_started)
+
+    return {
+        "cpu_us": statistics.fmean(cpu_times) * 1_000_000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "requests_per_cpu_second": len(cpu_times) / sum(cpu_times),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--athletes", type=int, default=10_000)
+    parser.add_argument("--centers", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000, help="requisições medidas por rota e modo")
+    args = parser.parse_args()
+    if make_url(settings.DB_URL).get_backend_name() != "postgresql":
+        parser.error("DB_URL precisa apontar para um PostgreSQL")
+
+    ids = await _reset_database(athletes=args.athletes, centers=args.centers)
+    max_page = args.athletes // 20
+    routes = {
+        "detalhe": [functools.partial(_detail, random.choice(ids)) for _ in range(args.requests)],
+        "listagem": [functools.partial(_list, random.randint(1, max_page)) for _ in range(args.requests)],
+    }
+
+    print(f"{'rota':<10} {'modo':<6} {'CPU/req (µs)':>13} {'req/s de CPU':>13} {'p50 (ms)':>9}")
+    for route, requests in routes.items():
+        for fast in (False, True):
+            settings.FAST_READER_ENABLED = fast
+            result = await _measure(requests)
+            print(
+                f"{route:<10} {'fast' if fast else 'orm':<6} {result['cpu_us']:>13.0f} "
+                f"{result['requests_per_cpu_second']:>13.0f} {result['p50_ms']:>9.2f}"
+            )
+    await dispose_async_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
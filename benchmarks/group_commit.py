@@ -0,0 +1,101 @@
+"""
+Teste de carga do group commit: criações concorrentes de atletas com o modo
+desligado (um commit por criação) e ligado (commits agrupados).
+
+Usa o banco de `DB_URL` (de preferência um PostgreSQL de teste: as tabelas são
+recriadas). Exemplo:
+
+    DB_URL=postgresql+asyncpg://workout@localhost/workout_test uv run python -m benchmarks.group_commit
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+from sqlalchemy import event  # noqa: E402
+
+import app.main  # noqa: E402,F401
+from app.contrib import ModelBase  # noqa: E402
+from app.core.batching import _group_committers  # noqa: E402
+from app.core.databases import dispose_async_engine, get_async_context_session, get_async_engine  # noqa: E402
+from app.modules.athlete.models import AthleteModel  # noqa: E402
+from app.modules.athlete.repository import AthleteRepository  # noqa: E402
+from app.modules.category.models import CategoryModel  # noqa: E402
+from app.modules.training_center.models import TrainingCenterModel  # noqa: E402
+
+
+async def _reset_database() -> tuple[int, int]:
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(ModelBase.metadata.drop_all)
+        await connection.run_sync(ModelBase.metadata.create_all)
+    async with get_async_context_session() as db_session:
+        category = CategoryModel(name="Scale")
+        training_center = TrainingCenterModel(name="CT", address="Rua 1", owner="Dono")
+        db_session.add_all([category, training_center])
+        await db_session.commit()
+        return category.pk_id, training_center.pk_id
+
+
+async def _run(*, grouped: bool, clients: int, creates: int) -> dict[str, float]:
+    category_id, training_center_id = await _reset_database()
+    _group_committers.clear()
+    repository = AthleteRepository(session_callable=get_async_context_session)
+    commits = 0
+
+    def count_commit(connection):
+        nonlocal commits
+        commits += 1
+
+    latencies: list[float] = []
+
+    async def client(client_index: int) -> None:
+        for i in range(creates):
+            index = client_index * creates + i
+            db_obj = AthleteModel(
+                name=f"Atleta {index}", document_number=f"{index:011d}", age=30, weight=70, height=1.75,
+                gender="M", category_id=category_id, training_center_id=training_center_id,
+            )
+            started = time.perf_counter()
+            if grouped:
+                await repository.create_grouped(obj_in=db_obj)
+            else:
+                async with get_async_context_session() as db_session:
+                    await repository.create(obj_in=db_obj, async_session=db_session)
+            latencies.append(time.perf_counter() - started)
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "commit", count_commit)
+    started = time.perf_counter()
+    await asyncio.gather(*[client(c) for c in range(clients)])
+    elapsed = time.perf_counter() - started
+    event.remove(sync_engine, "commit", count_commit)
+    await dispose_async_engine()
+
+    return {
+        "creates_per_second": len(latencies) / elapsed,
+        "commits_per_second": commits / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--creates", type=int, default=20, help="criações por cliente")
+    args = parser.parse_args()
+
+    print(f"{'modo':<10} {'criações/s':>12} {'commits/s':>10} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for grouped in (False, True):
+        result = await _run(grouped=grouped, clients=args.clients, creates=args.creates)
+        print(
+            f"{'grouped' if grouped else 'single':<10} {result['creates_per_second']:>12.0f} "
+            f"{result['commits_per_second']:>10.0f} {result['p50_ms']:>9.1f} {result['p99_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+"""
+Benchmark do particionamento de atletas: listagem por centro e inserções, antes e depois.
+
+Mede a latência da listagem filtrada por centro de treinamento (AthleteRepository.paginate)
+e a vazão de inserções concorrentes com a tabela `athletes` simples e depois de
+particionada por `partition_athletes` (a mesma cópia online de `make partition-athletes`).
+
+Usa o banco de `DB_URL`, que precisa ser um PostgreSQL descartável: o schema
+`public` é apagado e recriado. Exemplo:
+
+    DB_URL=postgresql+asyncpg://workout@localhost/workout_bench uv run python -m benchmarks.partitioning
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import make_url, select, text  # noqa: E402
+
+import app.main  # noqa: E402,F401
+from app.core.databases import dispose_async_engine, get_async_context_session, get_async_engine  # noqa: E402
+from app.core.settings import settings  # noqa: E402
+from app.modules.athlete.models import AthleteModel  # noqa: E402
+from app.modules.athlete.partitioning import partition_athletes  # noqa: E402
+from app.modules.athlete.repository import AthleteRepository  # noqa: E402
+from app.modules.athlete.schemas import AthleteFilter  # noqa: E402
+from app.modules.training_center.models import TrainingCenterModel  # noqa: E402
+
+WARMUP_LISTS = 50
+
+
+def _upgrade() -> None:
+    # O env.py do Alembic roda o próprio event loop: a migração fica fora do asyncio.run
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", settings.DB_URL.replace("%", "%%"))
+    command.upgrade(config, "head")
+
+
+async def _reset_schema() -> None:
+    async with get_async_engine().begin() as connection:
+        await connection.execute(text("DROP SCHEMA public CASCADE"))
+        await connection.execute(text("CREATE SCHEMA public"))
+    await dispose_async_engine()
+
+
+async def _seed(*, athletes: int, centers: int) -> None:
+    async with get_async_engine().begin() as connection:
+        await connection.execute(text(
+            "INSERT INTO categories (id, name, created_at) VALUES (gen_random_uuid(), 'Scale', now())"
+        ))
+        await connection.execute(text(
+            "INSERT INTO training_centers (id, name, address, owner, created_at) "
+            "SELECT gen_random_uuid(), 'CT ' || g, 'Rua ' || g, 'Dono ' || g, now() FROM generate_series(1, :centers) g"
+        ), {"centers": centers})
+        await connection.execute(text("""
+            INSERT INTO athletes (
+                id, name, document_number, age, weight, height, gender, created_at, category_id, training_center_id
+            )
+            SELECT
+                gen_random_uuid(), 'Atleta ' || g, lpad(g::text, 11, '0'), 20 + g % 30, 60 + g % 40,
+                1.6 + (g % 30) / 100.0, (ARRAY['M', 'F'])[g % 2 + 1], now(),
+                (SELECT min(pk_id) FROM categories), (SELECT min(pk_id) FROM training_centers) + g % :centers
+            FROM generate_series(1, :athletes) g
+        """), {"athletes": athletes, "centers": centers})
+    async with get_async_engine().connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("ANALYZE"))
+    await dispose_async_engine()
+
+
+async def _partition(partitions: int) -> None:
+    await partition_athletes(partitions)
+    await dispose_async_engine()
+
+
+async def _measure(*, lists: int, clients: int, creates: int, first_index: int) -> dict[str, float]:
+    repository = AthleteRepository()
+    async with get_async_context_session() as db_session:
+        category_id = (await db_session.execute(text("SELECT min(pk_id) FROM categories"))).scalar_one()
+        centers = (await db_session.execute(select(TrainingCenterModel.pk_id, TrainingCenterModel.id))).all()
+
+    list_latencies: list[float] = []
+    # As primeiras listagens (pool, cache de statements e de páginas) não entram na medição
+    for i in range(WARMUP_LISTS + lists):
+        _, center_id = random.choice(centers)
+        started = time.perf_counter()
+        async with get_async_context_session() as db_session:
+            await repository.paginate(
+                filter_in=AthleteFilter(training_center_id=center_id), page=1, size=20, async_session=db_session
+            )
+        if i >= WARMUP_LISTS:
+            list_latencies.append(time.perf_counter() - started)
+
+    async def client(client_index: int) -> None:
+        for i in range(creates):
+            index = first_index + client_index * creates + i
+            center_pk_id, _ = random.choice(centers)
+            db_obj = AthleteModel(
+                name=f"Atleta {index}", document_number=f"{index:011d}", age=30, weight=70, height=1.75,
+                gender="M", category_id=category_id, training_center_id=center_pk_id,
+            )
+            async with get_async_context_session() as db_session:
+                await repository.create(obj_in=db_obj, async_session=db_session)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client(c) for c in range(clients)])
+    elapsed = time.perf_counter() - started
+    await dispose_async_engine()
+
+    return {
+        "list_p50_ms": statistics.median(list_latencies) * 1000,
+        "list_p99_ms": statistics.quantiles(list_latencies, n=100)[98] * 1000,
+        "inserts_per_second": clients * creates / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--athletes", type=int, default=200_000)
+    parser.add_argument("--centers", type=int, default=50)
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--lists", type=int, default=1000, help="listagens medidas por fase")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--creates", type=int, default=50, help="inserções por cliente")
+    args = parser.parse_args()
+    if make_url(settings.DB_URL).get_backend_name() != "postgresql":
+        parser.error("DB_URL precisa apontar para um PostgreSQL")
+
+    asyncio.run(_reset_schema())
+    _upgrade()
+    asyncio.run(_seed(athletes=args.athletes, centers=args.centers))
+
+    measure = {"lists": args.lists, "clients": args.clients, "creates": args.creates}
+    results = {"simples": asyncio.run(_measure(**measure, first_index=args.athletes + 1))}
+
+    started = time.perf_counter()
+    asyncio.run(_partition(args.partitions))
+    partition_seconds = time.perf_counter() - started
+    results[f"{args.partitions} partições"] = asyncio.run(
+        _measure(**measure, first_index=args.athletes + args.clients * args.creates + 1)
+    )
+
+    print(f"{'tabela':<14} {'listagem p50 (ms)':>18} {'listagem p99 (ms)':>18} {'inserções/s':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<14} {result['list_p50_ms']:>18.2f} {result['list_p99_ms']:>18.2f} "
+            f"{result['inserts_per_second']:>12.0f}"
+        )
+    print(f"particionamento em {args.partitions} partições: {partition_seconds:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Benchmark dos ids públicos: UUID4 aleatório contra UUIDv7 (uuid7) no índice de `id`.
+
+Grava as mesmas quantidades de linhas em duas tabelas com o formato do ModelBase
+(`pk_id` serial + `id` UUID com índice único), uma com ids UUID4 e outra com ids
+do `uuid7()`, e compara:
+
+- a vazão de inserção e os blocos acessados por lote (localidade no índice);
+- o crescimento do índice de `id` ao longo das inserções;
+- buscas por ids recentes e por ids quaisquer: tempo, blocos acessados por id e
+  blocos lidos fora do shared_buffers (`Shared Read Blocks` do EXPLAIN (ANALYZE, BUFFERS)).
+
+Usa o banco de `DB_URL`, que precisa ser um PostgreSQL de teste: as tabelas
+`bench_ids_v4` e `bench_ids_v7` são recriadas. Para ver o efeito no cache, use
+mais linhas do que cabem no shared_buffers. Exemplo:
+
+    DB_URL=postgresql+asyncpg://workout@localhost/workout_test uv run python -m benchmarks.uuid_ids
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+os.environ.setdefault("WARMUP_ENABLED", "false")
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy import make_url, text  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from app.contrib.models import uuid7  # noqa: E402
+from app.core.databases import dispose_async_engine, get_async_engine  # noqa: E402
+from app.core.explain import Explain  # noqa: E402
+from app.core.settings import settings  # noqa: E402
+
+GENERATORS: dict[str, Callable[[], UUID]] = {"v4": uuid.uuid4, "v7": uuid7}
+GROWTH_POINTS = 5
+
+metadata = sa.MetaData()
+tables = {
+    name: sa.Table(
+        f"bench_ids_{name}",
+        metadata,
+        sa.Column("pk_id", sa.Integer, primary_key=True),
+        sa.Column("id", sa.UUID(as_uuid=True), nullable=False, unique=True, index=True),
+        sa.Column("payload", sa.String(50), nullable=False),
+    )
+    for name in GENERATORS
+}
+
+_INSERT_SQL = "INSERT INTO {table} (id, payload) SELECT id, 'atleta' FROM unnest(:ids) AS id"
+_LOOKUP_SQL = "SELECT pk_id FROM {table} WHERE id = ANY(:ids)"
+
+
+def _ids_param(ids: list[UUID]) -> sa.BindParameter[Any]:
+    return sa.bindparam("ids", ids, type_=postgresql.ARRAY(sa.UUID(as_uuid=True)))
+
+
+async def _explain_analyze(sql: str, ids: list[UUID]) -> dict[str, Any]:
+    """Executa `sql` com EXPLAIN (ANALYZE, BUFFERS) em uma transação própria e retorna o plano."""
+    statement = text(sql).bindparams(_ids_param(ids))
+    async with get_async_engine().begin() as connection:
+        plan = (await connection.execute(Explain(statement, "ANALYZE", "BUFFERS"))).scalar_one()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]
+
+
+async def _index_size(table: sa.Table) -> int:
+    async with get_async_engine().connect() as connection:
+        return (await connection.execute(
+            text("SELECT pg_relation_size(:index)"), {"index": f"ix_{table.name}_id"}
+        )).scalar_one()
+
+
+async def _reset() -> None:
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+        await connection.run_sync(metadata.create_all)
+
+
+async def _insert(name: str, *, rows: int, batch: int) -> tuple[dict[str, float], list[UUID]]:
+    table, generate = tables[name], GENERATORS[name]
+    ids: list[UUID] = []
+    touched: list[int] = []
+    growth: list[int] = []
+    checkpoint = rows // GROWTH_POINTS
+    started = time.perf_counter()
+    for first in range(0, rows, batch):
+        batch_ids = [generate() for _ in range(min(batch, rows - first))]
+        plan = await _explain_analyze(_INSERT_SQL.format(table=table.name), batch_ids)
+        touched.append(plan["Plan"]["Shared Hit Blocks"] + plan["Plan"]["Shared Read Blocks"])
+        ids += batch_ids
+        if checkpoint and len(ids) % checkpoint < batch:
+            growth.append(await _index_size(table))
+    elapsed = time.perf_counter() - started
+    return {
+        "inserts_per_second": rows / elapsed,
+        "touched_per_batch": statistics.fmean(touched),
+        "index_mb": (await _index_size(table)) / 1024 / 1024,
+        "growth_mb": [size / 1024 / 1024 for size in growth],
+    }, ids
+
+
+async def _lookups(name: str, ids: list[UUID], *, lookups: int, batch: int) -> dict[str, float]:
+    table = tables[name]
+    timings: list[float] = []
+    reads = hits = 0
+    for _ in range(lookups // batch):
+        plan = await _explain_analyze(_LOOKUP_SQL.format(table=table.name), random.sample(ids, batch))
+        timings.append(plan["Execution Time"] / batch)
+        reads += plan["Plan"]["Shared Read Blocks"]
+        hits += plan["Plan"]["Shared Hit Blocks"]
+    return {
+        "lookup_us": statistics.fmean(timings) * 1000,
+        "hit_ratio": hits / (hits + reads) if hits + reads else 1.0,
+        "blocks_per_lookup": (hits + reads) / (len(timings) * batch),
+        "reads_per_lookup": reads / (len(timings) * batch),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1000, help="linhas por transação de inserção")
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--recent", type=float, default=0.05, help="fração mais nova dos ids nas buscas recentes")
+    args = parser.parse_args()
+    if make_url(settings.DB_URL).get_backend_name() != "postgresql":
+        parser.error("DB_URL precisa apontar para um PostgreSQL")
+
+    await _reset()
+    inserts, lookups = {}, {}
+    for name in GENERATORS:
+        inserts[name], ids = await _insert(name, rows=args.rows, batch=args.batch)
+        recent = ids[-max(1, int(len(ids) * args.recent)):]
+        lookups[name] = {
+            "recentes": await _lookups(name, recent, lookups=args.lookups, batch=100),
+            "quaisquer": await _lookups(name, ids, lookups=args.lookups, batch=100),
+        }
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+    await dispose_async_engine()
+
+    print(f"{'id':<4} {'inserções/s':>12} {'blocos/lote':>12} {'índice (MB)':>12}  crescimento (MB)")
+    for name, result in inserts.items():
+        growth = " → ".join(f"{size:.1f}" for size in result["growth_mb"])
+        print(
+            f"{name:<4} {result['inserts_per_second']:>12.0f} {result['touched_per_batch']:>12.1f} "
+            f"{result['index_mb']:>12.1f}  {growth}"
+        )
+    print()
+    print(f"{'id':<4} {'busca':<10} {'µs/id':>7} {'blocos/id':>10} {'hit ratio':>10} {'leituras/id':>12}")
+    for name, by_kind in lookups.items():
+        for kind, result in by_kind.items():
+            print(
+                f"{name:<4} {kind:<10} {result['lookup_us']:>7.1f} {result['blocks_per_lookup']:>10.2f} "
+                f"{result['hit_ratio']:>10.3f} {result['reads_per_lookup']:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,84 @@
+import contextlib
+import os
+import tempfile
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# As settings são lidas na importação do app: o ambiente de teste vem antes.
+# Por padrão os testes usam SQLite; com TEST_DB_URL (ex: PostgreSQL local) os
+# testes marcados com `postgres` também rodam.
+os.environ["DB_URL"] = os.environ.get(
+    "TEST_DB_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/workout_test.db"
+)
+os.environ["WARMUP_ENABLED"] = "false"
+
+import app.main  # noqa: E402,F401  (registra todos os modelos e hooks)
+from app.contrib import ModelBase  # noqa: E402
+from app.core.databases import dispose_async_engine, get_async_context_session, get_async_engine  # noqa: E402
+from app.core.repository import AsyncSessionCallable  # noqa: E402
+from app.modules.category.models import CategoryModel  # noqa: E402
+from app.modules.training_center.models import TrainingCenterModel  # noqa: E402
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "postgres: precisa de TEST_DB_URL apontando para um PostgreSQL")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if os.environ["DB_URL"].startswith("postgresql"):
+        return
+    skip = pytest.mark.skip(reason="precisa de TEST_DB_URL apontando para um PostgreSQL")
+    for item in items:
+        if "postgres" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    """Cria as tabelas antes do teste e as remove depois."""
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(ModelBase.metadata.drop_all)
+        await connection.run_sync(ModelBase.metadata.create_all)
+    yield
+    async with get_async_engine().begin() as connection:
+        await connection.run_sync(ModelBase.metadata.drop_all)
+    await dispose_async_engine()
+
+
+@pytest.fixture
+async def category_and_training_center(database: None) -> tuple[CategoryModel, TrainingCenterModel]:
+    async with get_async_context_session() as db_session:
+        category = CategoryModel(name="Scale")
+        training_center = TrainingCenterModel(name="CT King", address="Rua das Flores, 123", owner="João")
+        db_session.add_all([category, training_center])
+        await db_session.commit()
+    return category, training_center
+
+
+
+@pytest.fixture
+async def session_callable(database: None) -> AsyncIterator[AsyncSessionCallable]:
+    """
+    Fábrica de sessões para repositórios chamados sem sessão explícita, como nas rotas.
+
+    O repositório não fecha essas sessões; aqui elas são fechadas no fim do teste,
+    antes de as tabelas serem removidas.
+    """
+    sessions: list[AsyncSession] = []
+
+    @contextlib.asynccontextmanager
+    async def tracked_session() -> AsyncIterator[AsyncSession]:
+        async with get_async_context_session() as db_session:
+            sessions.append(db_session)
+            yield db_session
+
+    yield tracked_session
+    for db_session in sessions:
+        await db_session.close()
@@ -0,0 +1,21 @@
+from typing import Any
+
+from app.modules.athlete.models import AthleteModel
+from app.modules.category.models import CategoryModel
+from app.modules.training_center.models import TrainingCenterModel
+
+
+def make_athlete(
+    category: CategoryModel, training_center: TrainingCenterModel, index: int, **fields: Any
+) -> AthleteModel:
+    values = {
+        "name": f"Atleta {index}",
+        "document_number": f"{index:011d}",
+        "age": 20 + index % 30,
+        "weight": 60 + index % 40,
+        "height": 1.6 + (index % 30) / 100,
+        "gender": "MF"[index % 2],
+        "category_id": category.pk_id,
+        "training_center_id": training_center.pk_id,
+    }
+    return AthleteModel(**(values | fields))
@@ -0,0 +1,160 @@
+import asyncio
+import statistics
+import time
+
+import httpx
+import pytest
+from starlette.types import Receive, Scope, Send
+
+from app.core.admission import PRIORITY_DETAIL, AdmissionControlMiddleware, AdmissionLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_slot_handed_over_at_the_deadline_is_not_leaked():
+    loop = asyncio.get_running_loop()
+    timeout = 0.005
+    for _ in range(200):
+        limiter = AdmissionLimiter(limit=1, max_queue=10, timeout=timeout)
+        assert await limiter.acquire()
+        # Libera no limite do prazo do próximo da fila: a vaga pode chegar junto com o timeout
+        loop.call_later(timeout, limiter.release)
+        if await limiter.acquire():
+            limiter.release()
+        await asyncio.sleep(0.001)
+        assert limiter.in_flight == 0
+
+
+async def test_cancelled_waiter_releases_slot_it_was_given():
+    limiter = AdmissionLimiter(limit=1, max_queue=10, timeout=1)
+    assert await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.release()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.in_flight == 0
+
+
+async def test_detail_waiters_are_served_first():
+    limiter = AdmissionLimiter(limit=1, max_queue=10, timeout=1)
+    assert await limiter.acquire()
+    served: list[str] = []
+
+    async def request(name: str, priority: int) -> None:
+        assert await limiter.acquire(priority)
+        served.append(name)
+        limiter.release()
+
+    tasks = [
+        asyncio.create_task(request("list-1", 1)),
+        asyncio.create_task(request("list-2", 1)),
+        asyncio.create_task(request("detail", PRIORITY_DETAIL)),
+    ]
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert served == ["detail", "list-1", "list-2"]
+
+
+async def test_overload_sheds_excess_requests_with_503():
+    async def slow_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = AdmissionControlMiddleware(
+        slow_app, read_limit=2, write_limit=2, max_queue=3, queue_timeout_ms=1000, retry_after=1
+    )
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(*[client.get("/api/v1/athletes/") for _ in range(10)])
+
+    statuses = sorted(response.status_code for response in responses)
+    # 2 executando + 3 na fila são atendidos; o restante é recusado na hora
+    assert statuses == [200] * 5 + [503] * 5
+    assert all(r.headers["Retry-After"] == "1" for r in responses if r.status_code == 503)
+    assert middleware.read_limiter.in_flight == 0
+
+
+async def test_queue_timeout_returns_503_and_frees_capacity():
+    release = asyncio.Event()
+
+    async def blocked_app(scope: Scope, receive: Receive, send: Send) -> None:
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = AdmissionControlMiddleware(
+        blocked_app, read_limit=1, write_limit=1, max_queue=5, queue_timeout_ms=20, retry_after=2
+    )
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/api/v1/athletes/"))
+        await asyncio.sleep(0.01)
+        queued = await client.get("/api/v1/athletes/")
+        release.set()
+        assert (await running).status_code == 200
+
+    assert queued.status_code == 503
+    assert middleware.read_limiter.in_flight == 0
+
+
+async def test_overload_keeps_p99_latency_bounded():
+    # O pool do banco é simulado por um semáforo: sem admissão, a fila cresce sem limite nele
+    service_time, pool_size, requests = 0.02, 4, 100
+    pool = asyncio.Semaphore(pool_size)
+
+    async def db_app(scope: Scope, receive: Receive, send: Send) -> None:
+        async with pool:
+            await asyncio.sleep(service_time)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def p99(app) -> tuple[float, list[int]]:
+        async def timed_get(client: httpx.AsyncClient) -> tuple[float, int]:
+            started = time.perf_counter()
+            response = await client.get("/api/v1/athletes/")
+            return time.perf_counter() - started, response.status_code
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            results = await asyncio.gather(*[timed_get(client) for _ in range(requests)])
+        return statistics.quantiles([latency for latency, _ in results], n=100)[98], [s for _, s in results]
+
+    unbounded_p99, _ = await p99(db_app)
+    middleware = AdmissionControlMiddleware(
+        db_app, read_limit=pool_size, write_limit=pool_size, max_queue=8, queue_timeout_ms=1000, retry_after=1
+    )
+    admitted_p99, statuses = await p99(middleware)
+
+    # Sem admissão, o último espera todos os outros: ~requests / pool_size * service_time
+    assert unbounded_p99 > requests / pool_size * service_time * 0.8
+    # Com admissão, quem é atendido espera no máximo a fila: (max_queue / limit + 1) * service_time
+    assert admitted_p99 < (8 / pool_size + 1) * service_time + 0.1
+    assert statuses.count(200) >= pool_size + 8
+    assert set(statuses) == {200, 503}
+
+
+async def test_batch_get_is_admitted_as_a_read():
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    middleware = AdmissionControlMiddleware(
+        app, read_limit=1, write_limit=1, max_queue=0, queue_timeout_ms=0, retry_after=1
+    )
+    # Com a vaga de escrita ocupada, o batch-get ainda passa pelo limite de leitura
+    assert await middleware.write_limiter.acquire()
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        batch_get = await client.post("/api/v1/athletes/batch-get", json={"ids": []})
+        create = await client.post("/api/v1/athletes/", json={})
+
+    assert batch_get.status_code == 200
+    assert create.status_code == 503
+    assert middleware.read_limiter.in_flight == 0
@@ -0,0 +1,121 @@
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+import app.main
+from app.contrib.dependencies import _get_athlete_repository
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.settings import settings
+from app.modules.athlete.repository import AthleteRepository
+from app.modules.category import controller as category_controller
+from app.modules.category.models import CategoryModel
+from app.modules.category.repository import CategoryRepository
+from tests.factories import make_athlete
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def categories(database) -> list[CategoryModel]:
+    async with get_async_context_session() as db_session:
+        db_categories = [CategoryModel(name=name) for name in ("Scale", "RX", "Elite")]
+        db_session.add_all(db_categories)
+        await db_session.commit()
+    return db_categories
+
+
+@pytest.fixture
+async def client(session_callable, monkeypatch):
+    # As rotas abrem as próprias sessões; aqui elas vêm da fábrica que as fecha no fim
+    monkeypatch.setattr(category_controller.category_repository, "_session_callable", session_callable)
+    app.main.app.dependency_overrides[_get_athlete_repository] = lambda: AthleteRepository(
+        session_callable=session_callable
+    )
+    transport = httpx.ASGITransport(app=app.main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.main.app.dependency_overrides.clear()
+
+
+async def test_get_many_keeps_input_order_and_duplicates(categories):
+    scale, rx, elite = categories
+    missing_id = uuid.uuid4()
+    ids = [elite.id, missing_id, scale.id, elite.id, rx.id]
+
+    async with get_async_context_session() as db_session:
+        db_objs = await CategoryRepository().get_many(ids, async_session=db_session)
+
+    assert [db_obj.name if db_obj else None for db_obj in db_objs] == ["Elite", None, "Scale", "Elite", "RX"]
+    assert db_objs[0] is db_objs[3]
+
+
+async def test_get_many_without_ids_skips_the_query(database):
+    assert await CategoryRepository().get_many([]) == []
+
+
+async def test_batch_get_route_marks_missing_ids(client, categories):
+    scale, rx, _ = categories
+    missing_id = uuid.uuid4()
+    ids = [str(rx.id), str(missing_id), str(scale.id), str(rx.id)]
+
+    response = await client.post("/api/v1/categories/batch-get", json={"ids": ids})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == ids
+    assert [item["found"] for item in items] == [True, False, True, True]
+    assert [item["item"] and item["item"]["name"] for item in items] == ["RX", None, "Scale", "RX"]
+
+
+async def test_athlete_batch_get_returns_nested_output(client, category_and_training_center):
+    category, training_center = category_and_training_center
+    async with get_async_context_session() as db_session:
+        db_athlete = make_athlete(category, training_center, 1)
+        db_session.add(db_athlete)
+        await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/athletes/batch-get", json={"ids": [str(uuid.uuid4()), str(db_athlete.id)]}
+    )
+
+    assert response.status_code == 200
+    missing, found = response.json()["items"]
+    assert missing["found"] is False and missing["item"] is None
+    assert found["item"]["name"] == "Atleta 1"
+    assert found["item"]["category"]["name"] == "Scale"
+    assert found["item"]["training_center"]["name"] == "CT King"
+
+
+@pytest.mark.parametrize("ids_count", [0, settings.BATCH_GET_MAX_IDS + 1])
+async def test_batch_get_rejects_empty_and_oversized_requests(client, ids_count):
+    ids = [str(uuid.uuid4()) for _ in range(ids_count)]
+
+    for resource in ("athletes", "categories", "training-centers"):
+        response = await client.post(f"/api/v1/{resource}/batch-get", json={"ids": ids})
+        assert response.status_code == 422
+
+
+@pytest.mark.postgres
+async def test_postgres_sends_ids_as_a_single_array_parameter(categories):
+    executed: list[tuple[str, tuple]] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        async with get_async_context_session() as db_session:
+            for ids in ([categories[0].id], [db_obj.id for db_obj in categories] + [uuid.uuid4()] * 50):
+                await CategoryRepository().get_many(ids, async_session=db_session)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    (one_statement, _), (many_statement, many_parameters) = executed
+    # Mesmo SQL para qualquer quantidade de IDs, com um único parâmetro de array
+    assert one_statement == many_statement
+    assert "= ANY (" in many_statement
+    assert len(many_parameters) == 1
+    assert len(many_parameters[0]) == 4
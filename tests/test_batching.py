@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from sqlalchemy import event, exc, func, select
+
+import app.main
+from app.core.batching import GroupCommitter
+from app.core.databases import dispose_async_engine, get_async_context_session, get_async_engine
+from app.core.settings import settings
+from app.modules.athlete.models import AthleteModel
+from app.modules.athlete.repository import AthleteRepository
+from tests.factories import make_athlete
+
+pytestmark = pytest.mark.anyio
+
+
+def _committer(**kwargs: float) -> GroupCommitter:
+    repository = AthleteRepository(session_callable=get_async_context_session)
+    return GroupCommitter(
+        get_async_context_session, repository._on_change, window_ms=kwargs.get("window_ms", 20), max_batch=100
+    )
+
+
+async def _count_athletes() -> int:
+    async with get_async_context_session() as db_session:
+        return (await db_session.execute(select(func.count()).select_from(AthleteModel))).scalar_one()
+
+
+async def test_concurrent_creates_share_one_commit(category_and_training_center):
+    category, training_center = category_and_training_center
+    commits = 0
+
+    def count_commit(connection):
+        nonlocal commits
+        commits += 1
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "commit", count_commit)
+    try:
+        committer = _committer()
+        db_objs = await asyncio.gather(
+            *[committer.submit(make_athlete(category, training_center, i)) for i in range(20)]
+        )
+    finally:
+        event.remove(sync_engine, "commit", count_commit)
+
+    assert commits == 1
+    assert all(db_obj.pk_id is not None for db_obj in db_objs)
+    assert await _count_athletes() == 20
+
+
+async def test_integrity_error_only_fails_its_own_caller(category_and_training_center):
+    category, training_center = category_and_training_center
+    committer = _committer()
+
+    results = await asyncio.gather(
+        committer.submit(make_athlete(category, training_center, 1)),
+        committer.submit(make_athlete(category, training_center, 2, document_number="00000000001")),
+        committer.submit(make_athlete(category, training_center, 3)),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], AthleteModel)
+    assert isinstance(results[1], exc.IntegrityError)
+    assert isinstance(results[2], AthleteModel)
+    assert await _count_athletes() == 2
+
+
+async def test_max_batch_flushes_without_waiting_for_the_window(category_and_training_center):
+    category, training_center = category_and_training_center
+    committer = GroupCommitter(
+        get_async_context_session,
+        AthleteRepository(session_callable=get_async_context_session)._on_change,
+        window_ms=60_000,
+        max_batch=5,
+    )
+
+    async with asyncio.timeout(5):
+        await asyncio.gather(*[committer.submit(make_athlete(category, training_center, i)) for i in range(5)])
+
+    assert await _count_athletes() == 5
+
+
+async def test_grouped_endpoint_creates_beyond_pool_size(category_and_training_center, monkeypatch):
+    category, training_center = category_and_training_center
+    monkeypatch.setattr(settings, "GROUP_COMMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 2)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    # Recria o engine com o pool pequeno
+    await dispose_async_engine()
+
+    def payload(index: int) -> dict[str, Any]:
+        return {
+            "name": f"Atleta {index}", "document_number": f"{index:011d}", "age": 30, "weight": 70,
+            "height": 1.75, "gender": "M", "category_id": str(category.id),
+            "training_center_id": str(training_center.id),
+        }
+
+    transport = httpx.ASGITransport(app=app.main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Sem devolver a conexão da requisição antes do lote, o pool esgota e tudo expira
+        async with asyncio.timeout(10):
+            responses = await asyncio.gather(*[client.post("/api/v1/athletes/", json=payload(i)) for i in range(6)])
+
+    assert [response.status_code for response in responses] == [200] * 6
+    assert await _count_athletes() == 6
+    assert get_async_engine().pool.checkedout() == 0
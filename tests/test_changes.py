@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, text
+
+from app.core.changes import ChangeFeed, publish_change
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.settings import settings
+from app.modules.category.models import CategoryModel
+from app.modules.category.repository import CategoryRepository
+from app.modules.category.schemas import CategoryInput
+
+pytestmark = pytest.mark.anyio
+
+
+async def _create_category(feed: ChangeFeed, name: str) -> CategoryModel:
+    async with get_async_context_session() as db_session:
+        category = CategoryModel(name=name)
+        db_session.add(category)
+        await db_session.flush()
+        await publish_change(db_session, "create", category)
+        await db_session.commit()
+        return category
+
+
+@pytest.fixture
+async def feed(database, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGES_ENABLED", True)
+    feed = ChangeFeed(buffer_size=500)
+    # publish_change entrega (após o commit, fora do PostgreSQL) ao feed global do módulo
+    monkeypatch.setattr("app.core.changes.change_feed", feed)
+    yield feed
+    await feed.close()
+
+
+async def test_committed_change_reaches_subscriber(feed):
+    subscription = await feed.subscribe(tables=[CategoryModel.__tablename__])
+
+    category = await _create_category(feed, "Scale")
+
+    async with asyncio.timeout(5):
+        change = await subscription.get()
+    assert change == {"table": "categories", "action": "create", "id": str(category.id)}
+
+
+@pytest.mark.postgres
+async def test_listener_uses_dedicated_connection_and_reconnects(feed):
+    subscription = await feed.subscribe()
+    pool = get_async_engine().sync_engine.pool
+    # A conexão de LISTEN não sai do pool das requisições
+    assert pool.checkedout() == 0
+    original_listener = feed._listener
+
+    async with get_async_engine().connect() as connection:
+        terminated = (await connection.execute(text(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE application_name LIKE 'workout-api-listener:%'"
+        ))).scalars().all()
+    assert terminated == [True]
+
+    async with asyncio.timeout(5):
+        while feed._listener is None or feed._listener is original_listener:
+            await asyncio.sleep(0.05)
+
+    category = await _create_category(feed, "Scale")
+    async with asyncio.timeout(5):
+        change = await subscription.get()
+    assert change["id"] == str(category.id)
+
+
+async def test_nothing_is_published_when_disabled(feed, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGES_ENABLED", False)
+    subscription = await feed.subscribe()
+
+    await _create_category(feed, "Scale")
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.2):
+            await subscription.get()
+
+
+async def test_rolled_back_changes_are_discarded(feed):
+    subscription = await feed.subscribe()
+    async with get_async_context_session() as db_session:
+        category = CategoryModel(name="Scale")
+        db_session.add(category)
+        await db_session.flush()
+        await publish_change(db_session, "create", category)
+        await db_session.rollback()
+
+    await _create_category(feed, "RX")
+    async with asyncio.timeout(5):
+        change = await subscription.get()
+    assert change["action"] == "create" and change["id"] != str(category.id)
+
+
+@pytest.mark.postgres
+async def test_one_notify_round_trip_per_transaction(feed):
+    subscription = await feed.subscribe(tables=[CategoryModel.__tablename__])
+    notifies: list[str] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        if "pg_notify" in statement:
+            notifies.append(statement)
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        # 150 eventos passam do limite de 8000 bytes de um NOTIFY: vão em mais de um, na mesma query
+        async with get_async_context_session() as db_session:
+            db_categories = await CategoryRepository().create_many(
+                obj_in=[CategoryInput(name=f"Categoria {index}") for index in range(150)],
+                async_session=db_session,
+            )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    assert len(notifies) == 1
+    async with asyncio.timeout(5):
+        received = [(await subscription.get())["id"] for _ in db_categories]
+    assert received == [str(category.id) for category in db_categories]
@@ -0,0 +1,113 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive, Scope, Send
+
+from app.core.coalescing import RequestCoalescingMiddleware, SingleFlight
+from app.core.databases import get_async_engine
+from app.core.settings import settings
+from app.modules.category.repository import CategoryRepository
+
+pytestmark = pytest.mark.anyio
+
+CONCURRENT_REQUESTS = 500
+
+
+async def test_concurrent_identical_reads_execute_once(monkeypatch, category_and_training_center, session_callable):
+    category, _ = category_and_training_center
+    monkeypatch.setattr(settings, "COALESCE_ENABLED", True)
+
+    @contextlib.asynccontextmanager
+    async def slow_session() -> AsyncIterator[AsyncSession]:
+        # Mantém o líder em voo enquanto todas as chamadas concorrentes chegam
+        await asyncio.sleep(0.05)
+        async with session_callable() as db_session:
+            yield db_session
+
+    repository = CategoryRepository(session_callable=slow_session)
+    statements: list[str] = []
+
+    def count_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_select)
+    try:
+        results = await asyncio.gather(*[repository.get(category.pk_id) for _ in range(CONCURRENT_REQUESTS)])
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_select)
+
+    assert len(statements) == 1
+    assert {result.pk_id for result in results} == {category.pk_id}
+
+
+async def test_concurrent_identical_requests_run_the_app_once():
+    executions = 0
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+    middleware = RequestCoalescingMiddleware(app, max_wait_ms=5000)
+    limits = httpx.Limits(max_connections=None)
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", limits=limits) as client:
+        # Mesma query string em outra ordem deve cair na mesma chave
+        urls = ["/api/v1/categories/?a=1&b=2", "/api/v1/categories/?b=2&a=1"]
+        responses = await asyncio.gather(*[client.get(urls[i % 2]) for i in range(CONCURRENT_REQUESTS)])
+
+    assert executions == 1
+    assert all(response.status_code == 200 and response.json() == {"ok": True} for response in responses)
+
+
+async def test_followers_run_on_their_own_when_leader_is_cancelled():
+    single_flight = SingleFlight(max_wait=5)
+    started = asyncio.Event()
+    executions = 0
+
+    async def fetch() -> int:
+        nonlocal executions
+        executions += 1
+        started.set()
+        await asyncio.sleep(0.05)
+        return executions
+
+    leader = asyncio.create_task(single_flight.do("key", fetch))
+    await started.wait()
+    followers = [asyncio.create_task(single_flight.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    results = await asyncio.gather(*followers)
+
+    assert leader.cancelled()
+    # Cada seguidor executou por conta própria; nenhum herdou o cancelamento do líder
+    assert executions == 1 + len(followers)
+    assert all(isinstance(result, int) for result in results)
+
+
+async def test_cancelled_follower_does_not_affect_leader():
+    single_flight = SingleFlight(max_wait=5)
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.create_task(single_flight.do("key", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.do("key", fetch))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+    assert await leader == "ok"
@@ -0,0 +1,199 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, available_encodings
+
+pytestmark = pytest.mark.anyio
+
+BODY = {"items": [{"name": f"Atleta {index}", "category": "Scale"} for index in range(100)]}
+CHUNKS = [json.dumps({"event": index, "padding": "x" * 200}).encode() + b"\n" for index in range(5)]
+
+
+def _app(**options) -> CompressionMiddleware:
+    app = FastAPI()
+
+    @app.get("/athletes")
+    async def athletes():
+        return BODY
+
+    @app.get("/tagged")
+    async def tagged():
+        return JSONResponse(BODY, headers={"etag": '"v1"'})
+
+    @app.get("/sized/{size}")
+    async def sized(size: int):
+        return Response(b"a" * size, media_type="text/plain")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for chunk in CHUNKS:
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/events")
+    async def events():
+        return Response(b"data: " + b"x" * 4096 + b"\n\n", media_type="text/event-stream")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(b"a" * 4096), media_type="text/plain", headers={"content-encoding": "gzip"})
+
+    return CompressionMiddleware(app, **options)
+
+
+async def _get(app: CompressionMiddleware, path: str, accept_encoding: str = "gzip") -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"accept-encoding": accept_encoding})
+
+
+def _without(encoding: str) -> str | None:
+    others = [name for name in available_encodings() if name != encoding]
+    return others[0] if others else None
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", "gzip"),
+        ("GZIP;Q=0.5", "gzip"),
+        ("deflate, gzip;q=0.4", "gzip"),
+        ("gzip;q=0", None),
+        ("deflate", None),
+        ("", None),
+        ("*", available_encodings()[0]),
+        ("*;q=0.1, gzip;q=1", "gzip"),
+        ("*, gzip;q=0", _without("gzip")),
+        ("*;q=0", None),
+        ("identity", None),
+        ("identity;q=1, gzip;q=0.5", None),
+        ("gzip;q=0.5, identity;q=0.1", "gzip"),
+        ("gzip, identity;q=0", "gzip"),
+        ("gzip;q=abc", None),
+    ],
+)
+async def test_accept_encoding_negotiation(accept_encoding, expected):
+    response = await _get(_app(), "/athletes", accept_encoding)
+
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == BODY
+
+
+async def test_server_preference_breaks_ties():
+    response = await _get(_app(), "/athletes", ", ".join(reversed(available_encodings())))
+
+    assert response.headers["content-encoding"] == available_encodings()[0]
+
+
+@pytest.mark.parametrize(("size", "expected"), [(1023, None), (1024, "gzip")])
+async def test_minimum_size(size, expected):
+    response = await _get(_app(minimum_size=1024), f"/sized/{size}")
+
+    assert response.headers.get("content-encoding") == expected
+    assert response.content == b"a" * size
+    if expected:
+        assert int(response.headers["content-length"]) < size
+
+
+async def test_streaming_response_is_compressed_chunk_by_chunk():
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+    disconnected = asyncio.Event()
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "root_path": "",
+        "query_string": b"", "headers": [(b"accept-encoding", b"gzip")], "http_version": "1.1",
+        "scheme": "http", "server": ("test", 80), "client": ("test", 1234),
+    }
+    await _app()(scope, receive, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    # Cada pedaço já chega decodificável (flush), sem esperar o fim do stream
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    received = [decompressor.decompress(message["body"]) for message in bodies]
+    assert received[:len(CHUNKS)] == CHUNKS
+    assert b"".join(received) == b"".join(CHUNKS)
+    assert bodies[-1]["more_body"] is False and decompressor.eof
+
+
+@pytest.fixture
+def compressions(monkeypatch) -> list[int]:
+    """Conta as compressões feitas com gzip."""
+    calls: list[int] = []
+    factory, level = compression._COMPRESSORS["gzip"]
+
+    def counting_factory(level: int):
+        calls.append(level)
+        return factory(level)
+
+    monkeypatch.setitem(compression._COMPRESSORS, "gzip", (counting_factory, level))
+    return calls
+
+
+@pytest.mark.parametrize("path", ["/athletes", "/tagged"])
+async def test_etag_cache_skips_the_second_compression(compressions, path):
+    app = _app()
+
+    first = await _get(app, path)
+    second = await _get(app, path)
+
+    assert len(compressions) == 1
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.content == second.content and second.json() == BODY
+    if path == "/tagged":
+        assert first.headers["etag"] == '"v1"'
+    else:
+        assert first.headers["etag"].startswith('W/"')
+
+
+async def test_cache_keys_by_body_and_can_be_disabled(compressions):
+    app = _app()
+    await _get(app, "/sized/2000")
+    await _get(app, "/sized/3000")
+    assert len(compressions) == 2
+
+    app = _app(cache_size=0)
+    await _get(app, "/athletes")
+    await _get(app, "/athletes")
+    assert len(compressions) == 4
+
+
+@pytest.mark.parametrize("path", ["/events", "/encoded"])
+async def test_event_streams_and_encoded_responses_pass_through(compressions, path):
+    app = _app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"accept-encoding": "gzip"}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert compressions == []
+    assert "vary" not in response.headers
+    if path == "/events":
+        assert "content-encoding" not in response.headers
+        assert raw.startswith(b"data: ")
+    else:
+        # Já codificada pela aplicação: sai como veio, sem segunda compressão
+        assert gzip.decompress(raw) == b"a" * 4096
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.core import databases
+from app.core.settings import settings
+
+WORKERS = 3
+
+
+async def _connection_identity() -> str:
+    """Identifica a conexão do pool no servidor (pid do backend) ou no cliente (SQLite)."""
+    async with databases.get_async_engine().connect() as connection:
+        if connection.dialect.name == "postgresql":
+            return str((await connection.execute(text("SELECT pg_backend_pid()"))).scalar_one())
+        raw_connection = await connection.get_raw_connection()
+        return f"{os.getpid()}:{id(raw_connection.driver_connection)}"
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_forked_child_does_not_reuse_parent_pool():
+    # Um único loop no pai (conexões asyncpg ficam presas ao loop em que foram abertas),
+    # e nenhum loop rodando no momento do fork
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(databases.dispose_async_engine())
+    parent_engine = databases.get_async_engine()
+    parent_connection = loop.run_until_complete(_connection_identity())
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Processo filho: só reporta pelo pipe e sai sem rodar o resto do pytest
+        try:
+            child_engine = databases.get_async_engine()
+            child_connection = asyncio.new_event_loop().run_until_complete(_connection_identity())
+            # O hook de fork descarta (sem fechar) as conexões herdadas do pool do pai
+            inherited = parent_engine.sync_engine.pool.checkedin()
+            report = f"{child_engine is parent_engine}|{inherited}|{child_connection}"
+        except BaseException as e:
+            report = f"error|{e!r}"
+        os.write(write_fd, report.encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        same_engine, inherited, child_connection = pipe.read().split("|", 2)
+
+    try:
+        assert same_engine == "False", child_connection
+        assert inherited == "0"
+        assert child_connection != parent_connection
+        # O pool do pai continua utilizável depois do fork, com a mesma conexão
+        assert databases.get_async_engine() is parent_engine
+        assert loop.run_until_complete(_connection_identity()) == parent_connection
+    finally:
+        loop.run_until_complete(databases.dispose_async_engine())
+        loop.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _pool_connections_by_process() -> dict[int, set[int]]:
+    """{pid do processo da API: {pid do backend}} a partir do application_name."""
+    async with databases.get_async_engine().connect() as connection:
+        rows = await connection.execute(text(
+            "SELECT application_name, pid FROM pg_stat_activity "
+            "WHERE application_name LIKE 'workout-api:%' AND pid <> pg_backend_pid()"
+        ))
+        connections: dict[int, set[int]] = {}
+        for application_name, backend_pid in rows:
+            connections.setdefault(int(application_name.split(":")[1]), set()).add(backend_pid)
+    await databases.dispose_async_engine()
+    return connections
+
+
+@pytest.mark.postgres
+def test_each_worker_opens_its_own_connections():
+    env = os.environ | {
+        "DB_URL": settings.DB_URL,
+        "WORKERS": str(WORKERS),
+        "PORT": str(_free_port()),
+        "DB_POOL_SIZE": str(WORKERS * 2),
+        "WARMUP_ENABLED": "true",
+        "WARMUP_CONNECTIONS": "2",
+    }
+    server = subprocess.Popen([sys.executable, "-m", "app"], env=env, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 30
+        connections: dict[int, set[int]] = {}
+        while time.monotonic() < deadline and len(connections) < WORKERS:
+            time.sleep(0.5)
+            connections = asyncio.run(_pool_connections_by_process())
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    assert len(connections) == WORKERS
+    # Nenhuma conexão foi aberta pelo processo principal e herdada pelos workers
+    assert server.pid not in connections
+    # Cada backend do PostgreSQL pertence a um único worker
+    backends = [backend for worker_backends in connections.values() for backend in worker_backends]
+    assert len(backends) == len(set(backends))
+    assert all(len(worker_backends) == 2 for worker_backends in connections.values())
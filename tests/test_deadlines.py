@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from sqlalchemy import func, select, text
+from starlette.types import Message
+
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.deadlines import DeadlineExceeded, RequestDeadlineMiddleware, query_metrics
+from app.main import deadline_exceeded_handler
+from app.modules.category.repository import CategoryRepository
+
+pytestmark = pytest.mark.anyio
+
+
+class _Observed:
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.background_done = False
+
+
+def _app(observed: _Observed) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/slow")
+    async def slow():
+        # Substituto local de um `pg_sleep` no banco: só termina se for cancelado
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            observed.cancelled = True
+            raise
+
+    @app.get("/api/fast")
+    async def fast(background_tasks: BackgroundTasks):
+        async def after_response() -> None:
+            await asyncio.sleep(0.05)
+            observed.background_done = True
+
+        background_tasks.add_task(after_response)
+        return {"ok": True}
+
+    return app
+
+
+async def _call(
+    middleware: RequestDeadlineMiddleware,
+    path: str,
+    *,
+    headers: list[tuple[bytes, bytes]] = (),
+    disconnect: asyncio.Event | None = None,
+) -> list[Message]:
+    """
+    Executa a requisição como um servidor ASGI: após o corpo, `receive` só retorna
+    `http.disconnect` — quando `disconnect` é sinalizado ou a resposta termina.
+    """
+    sent: list[Message] = []
+    response_complete = asyncio.Event()
+    request_messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> Message:
+        if request_messages:
+            return request_messages.pop(0)
+        waiters = [asyncio.create_task(response_complete.wait())]
+        if disconnect is not None:
+            waiters.append(asyncio.create_task(disconnect.wait()))
+        _, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": list(headers),
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+    await middleware(scope, receive, send)
+    return sent
+
+
+def _middleware(observed: _Observed, **options) -> RequestDeadlineMiddleware:
+    options = {"default_timeout_ms": None, "max_timeout_ms": 30000} | options
+    return RequestDeadlineMiddleware(_app(observed), **options)
+
+
+async def test_deadline_cancels_the_work_and_returns_504():
+    observed = _Observed()
+    before = query_metrics.deadline_exceeded
+
+    async with asyncio.timeout(5):
+        sent = await _call(_middleware(observed), "/api/slow", headers=[(b"x-request-timeout-ms", b"50")])
+
+    assert sent[0]["status"] == 504
+    assert observed.cancelled
+    assert query_metrics.deadline_exceeded == before + 1
+
+
+async def test_client_disconnect_cancels_the_work():
+    observed = _Observed()
+    disconnect = asyncio.Event()
+    before = query_metrics.client_disconnects
+
+    asyncio.get_running_loop().call_later(0.05, disconnect.set)
+    async with asyncio.timeout(5):
+        sent = await _call(_middleware(observed), "/api/slow", disconnect=disconnect)
+
+    assert sent == []
+    assert observed.cancelled
+    assert query_metrics.client_disconnects == before + 1
+
+
+async def test_work_after_the_response_is_not_cancelled():
+    observed = _Observed()
+    before = query_metrics.as_dict()
+
+    # O servidor reporta `http.disconnect` assim que a resposta termina
+    sent = await _call(_middleware(observed, default_timeout_ms=1000), "/api/fast")
+
+    assert sent[0]["status"] == 200
+    assert observed.background_done
+    assert query_metrics.as_dict() == before
+
+
+@pytest.mark.parametrize("value", [b"nan", b"inf", b"-inf", b"-5", b"0", b"abc"])
+def test_invalid_timeout_header_falls_back_to_default(value):
+    middleware = _middleware(_Observed(), default_timeout_ms=1500)
+
+    assert middleware._timeout({"headers": [(b"x-request-timeout-ms", value)]}) == 1.5
+
+
+def test_timeout_header_is_capped_by_max():
+    middleware = _middleware(_Observed(), default_timeout_ms=None, max_timeout_ms=2000)
+
+    assert middleware._timeout({"headers": [(b"x-request-timeout-ms", b"250")]}) == 0.25
+    assert middleware._timeout({"headers": [(b"x-request-timeout-ms", b"60000")]}) == 2
+
+
+async def test_nan_header_does_not_give_immediate_504():
+    observed = _Observed()
+
+    sent = await _call(_middleware(observed), "/api/fast", headers=[(b"x-request-timeout-ms", b"nan")])
+
+    assert sent[0]["status"] == 200
+
+
+@pytest.mark.postgres
+async def test_deadline_cancels_the_database_query_and_the_pool_recovers(database):
+    app = FastAPI()
+    app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+    repository = CategoryRepository()
+
+    @app.get("/api/sleep")
+    async def sleep():
+        async with get_async_context_session() as db_session:
+            await repository._execute(db_session, select(func.pg_sleep(30)), origin="sleep")
+
+    middleware = RequestDeadlineMiddleware(app, default_timeout_ms=100, max_timeout_ms=30000)
+    before = query_metrics.as_dict()
+
+    async with asyncio.timeout(5):
+        sent = await _call(middleware, "/api/sleep")
+
+    assert sent[0]["status"] == 504
+    assert query_metrics.cancelled_queries == before["cancelled_queries"] + 1
+    assert query_metrics.deadline_exceeded == before["deadline_exceeded"] + 1
+    engine = get_async_engine()
+    assert engine.pool.checkedout() == 0
+
+    # A query foi cancelada no servidor e a conexão devolvida ao pool segue utilizável
+    async with engine.connect() as connection:
+        running = (await connection.execute(text(
+            "SELECT count(*) FROM pg_stat_activity WHERE state = 'active' AND query LIKE '%pg_sleep%' "
+            "AND pid <> pg_backend_pid()"
+        ))).scalar_one()
+        assert running == 0
+        assert (await connection.execute(text("SELECT 1"))).scalar_one() == 1
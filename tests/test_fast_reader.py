@@ -0,0 +1,116 @@
+import uuid
+from typing import Any
+
+import pytest
+
+from app.core.databases import get_async_context_session
+from app.core.repository import Page
+from app.core.settings import settings
+from app.modules.athlete.models import AthleteModel
+from app.modules.athlete.repository import AthleteRepository
+from app.modules.athlete.schemas import AthleteFilter, AthleteOutput
+from app.modules.training_center.models import TrainingCenterModel
+from tests.factories import make_athlete
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+ATHLETES = 45
+
+
+@pytest.fixture
+async def seed(category_and_training_center) -> tuple[list[AthleteModel], TrainingCenterModel]:
+    category, training_center = category_and_training_center
+    async with get_async_context_session() as db_session:
+        other_center = TrainingCenterModel(name="CT Queen", address="Rua dos Ipês, 45", owner="Maria")
+        db_session.add(other_center)
+        await db_session.flush()
+        db_athletes = [
+            make_athlete(category, other_center if index % 3 == 0 else training_center, index)
+            for index in range(ATHLETES)
+        ]
+        db_session.add_all(db_athletes)
+        await db_session.commit()
+    return db_athletes, other_center
+
+
+@pytest.fixture
+def repository(session_callable) -> AthleteRepository:
+    # Como nas rotas, o repositório abre as próprias sessões
+    return AthleteRepository(session_callable=session_callable)
+
+
+async def _both_paths(monkeypatch, call) -> tuple[Any, Any]:
+    monkeypatch.setattr(settings, "FAST_READER_ENABLED", False)
+    orm = await call()
+    monkeypatch.setattr(settings, "FAST_READER_ENABLED", True)
+    fast = await call()
+    return orm, fast
+
+
+def _page_json(page: Page) -> dict[str, Any]:
+    return Page[AthleteOutput].model_validate(page).model_dump(mode="json")
+
+
+# Um caso por campo do AthleteFilter, a partir dos atletas e do segundo centro criados
+FILTERS = {
+    "id": lambda athletes, center: {"id": athletes[4].id},
+    "document_number": lambda athletes, center: {"document_number": athletes[5].document_number},
+    "name": lambda athletes, center: {"name": athletes[7].name},
+    "age": lambda athletes, center: {"age": athletes[6].age},
+    "weight": lambda athletes, center: {"weight": int(athletes[8].weight)},
+    "height": lambda athletes, center: {"height": athletes[2].height},
+    "gender": lambda athletes, center: {"gender": "F"},
+    "training_center_id": lambda athletes, center: {"training_center_id": center.id},
+    "gender_and_age": lambda athletes, center: {"gender": "M", "age": athletes[1].age},
+    "no_filter": lambda athletes, center: {},
+    "no_match": lambda athletes, center: {"name": "Ninguém"},
+    "unknown_training_center": lambda athletes, center: {"training_center_id": uuid.uuid4()},
+}
+
+
+def test_every_filter_field_is_covered():
+    covered = {field for make_filter in FILTERS.values() for field in make_filter([_Any()] * ATHLETES, _Any())}
+    assert covered == set(AthleteFilter.model_fields) - {"page", "size"}
+
+
+class _Any:
+    """Atleta/centro de mentira, só para descobrir quais campos cada caso de FILTERS usa."""
+
+    def __getattr__(self, name: str) -> Any:
+        return 1
+
+
+@pytest.mark.parametrize("filter_name", FILTERS)
+@pytest.mark.parametrize(("page", "size"), [(1, 20), (2, 20), (3, 20), (100, 20), (1, 1)])
+async def test_paginate_output_matches_orm(monkeypatch, repository, seed, filter_name, page, size):
+    filter_in = AthleteFilter(**FILTERS[filter_name](*seed))
+
+    orm, fast = await _both_paths(
+        monkeypatch, lambda: repository.paginate_output(filter_in=filter_in, page=page, size=size)
+    )
+
+    assert _page_json(fast) == _page_json(orm)
+
+
+async def test_pages_cover_every_athlete_once(monkeypatch, repository, seed):
+    athletes, _ = seed
+    monkeypatch.setattr(settings, "FAST_READER_ENABLED", True)
+    names = []
+    for page in range(1, 5):
+        result = await repository.paginate_output(filter_in=AthleteFilter(), page=page, size=20)
+        names += [item["name"] for item in result.items]
+
+    assert names == [athlete.name for athlete in athletes]
+
+
+async def test_get_output_matches_orm(monkeypatch, repository, seed):
+    athletes, _ = seed
+    for athlete_id in (athletes[0].id, athletes[-1].id):
+        orm, fast = await _both_paths(monkeypatch, lambda: repository.get_output(athlete_id))
+        assert (
+            AthleteOutput.model_validate(fast).model_dump(mode="json")
+            == AthleteOutput.model_validate(orm).model_dump(mode="json")
+        )
+
+    orm, fast = await _both_paths(monkeypatch, lambda: repository.get_output(uuid.uuid4()))
+    assert orm is None and fast is None
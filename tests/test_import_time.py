@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+# Orçamentos de importação de `app.main`, em milissegundos (`python -X importtime`).
+# O total inclui FastAPI/SQLAlchemy/Pydantic; o próprio conta só os módulos `app.*`.
+TOTAL_BUDGET_MS = 3000
+OWN_BUDGET_MS = 300
+
+
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Retorna {módulo: (self_us, cumulative_us)} para a importação em um processo novo."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _own_modules(times: dict[str, tuple[int, int]]) -> dict[str, tuple[int, int]]:
+    return {name: value for name, value in times.items() if name == "app" or name.startswith("app.")}
+
+
+def test_app_import_time_within_budget():
+    times = _import_times("import app.main")
+
+    total_ms = times["app.main"][1] / 1000
+    own_ms = sum(self_us for self_us, _ in _own_modules(times).values()) / 1000
+    assert total_ms < TOTAL_BUDGET_MS, f"import app.main levou {total_ms:.0f} ms"
+    assert own_ms < OWN_BUDGET_MS, f"módulos app.* levaram {own_ms:.0f} ms"
+
+
+def test_schemas_do_not_import_controllers():
+    # Importar schemas não pode puxar controllers, dependências e rotas (cadeias de `import *`)
+    times = _import_times("import app.modules.athlete.schemas")
+
+    loaded = set(_own_modules(times))
+    assert not {name for name in loaded if name.endswith(".controller")}
+    assert "app.contrib.dependencies" not in loaded
+    assert "app.core.repository" not in loaded
@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.contrib import models
+from app.contrib.models import uuid7
+from app.core.databases import get_async_context_session
+from app.modules.athlete.models import AthleteModel
+from tests.factories import make_athlete
+
+
+def test_uuid7_sets_version_and_variant():
+    for _ in range(1000):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_orders_by_time_across_milliseconds(monkeypatch):
+    # Do fim de um milissegundo para o início do próximo: a ordem segue o timestamp
+    instants = [1_700_000_000_000_999_999, 1_700_000_000_001_000_000, 1_700_000_000_002_500_000]
+    values = []
+    for instant in instants:
+        monkeypatch.setattr(models.time, "time_ns", lambda instant=instant: instant)
+        values.append(uuid7())
+
+    assert values == sorted(values)
+    assert [value.int >> 80 for value in values] == [1_700_000_000_000, 1_700_000_000_001, 1_700_000_000_002]
+
+
+def test_uuid7_is_ordered_and_unique_within_a_process():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert len(set(values)) == len(values)
+    # Timestamp e fração do milissegundo (os 64 bits iniciais) nunca voltam para trás
+    assert [value.int >> 64 for value in values] == sorted(value.int >> 64 for value in values)
+
+
+@pytest.mark.anyio
+async def test_each_row_gets_its_own_id(category_and_training_center):
+    category, training_center = category_and_training_center
+    async with get_async_context_session() as db_session:
+        db_session.add_all([make_athlete(category, training_center, index) for index in range(20)])
+        await db_session.commit()
+        ids = (await db_session.execute(select(AthleteModel.id))).scalars().all()
+
+    assert len(set(ids)) == 20
+    assert all(value.version == 7 for value in ids)
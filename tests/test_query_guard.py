@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import event
+
+from app.core import repository as repository_module
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.repository import ExpensiveQueryError
+from app.core.settings import settings
+from app.modules.athlete.repository import AthleteRepository
+from app.modules.athlete.schemas import AthleteFilter
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+
+@pytest.fixture
+def explained(monkeypatch, database):
+    """Liga o guard com cache vazio e coleta os `EXPLAIN` enviados ao banco."""
+    monkeypatch.setattr(settings, "QUERY_GUARD_ENABLED", True)
+    monkeypatch.setattr(settings, "QUERY_GUARD_MODE", "reject")
+    monkeypatch.setattr(repository_module, "_query_costs", {})
+    statements: list[str] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("EXPLAIN"):
+            statements.append(statement)
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", collect)
+
+
+async def test_paginate_explains_the_executed_statements(explained):
+    async with get_async_context_session() as db_session:
+        await AthleteRepository().paginate(
+            filter_in=AthleteFilter(gender="M"), page=3, size=10, async_session=db_session
+        )
+
+    # A contagem e a página com LIMIT/OFFSET, exatamente como executadas
+    assert len(explained) == 2
+    assert "count(*)" in explained[0]
+    assert "LIMIT" in explained[1] and "OFFSET" in explained[1]
+
+
+async def test_find_all_explains_the_limited_statement(explained):
+    async with get_async_context_session() as db_session:
+        await AthleteRepository().find_all(
+            filter_in=AthleteFilter(gender="M"), skip=5, limit=10, async_session=db_session
+        )
+
+    assert len(explained) == 1
+    assert "LIMIT" in explained[0] and "OFFSET" in explained[0]
+
+
+async def test_verdict_is_cached_per_shape_and_row_window(explained):
+    repository = AthleteRepository()
+
+    async with get_async_context_session() as db_session:
+        await repository.find_all(filter_in=AthleteFilter(gender="M"), limit=10, async_session=db_session)
+        await repository.find_all(filter_in=AthleteFilter(gender="F"), skip=2, limit=10, async_session=db_session)
+        assert len(explained) == 1
+
+        # Páginas muito mais profundas percorrem mais linhas e têm outro custo
+        await repository.find_all(
+            filter_in=AthleteFilter(gender="M"), skip=100_000, limit=10, async_session=db_session
+        )
+        assert len(explained) == 2
+
+
+async def test_expensive_query_is_rejected(explained, monkeypatch):
+    monkeypatch.setattr(settings, "QUERY_GUARD_MAX_COST", 0.001)
+
+    async with get_async_context_session() as db_session:
+        with pytest.raises(ExpensiveQueryError):
+            await AthleteRepository().paginate(filter_in=AthleteFilter(name="Atleta 1"), async_session=db_session)
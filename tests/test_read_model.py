@@ -0,0 +1,164 @@
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import event, func, select
+
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.repository import Page
+from app.core.settings import settings
+from app.modules.athlete.read_model import AthleteReadModel, find_read_model_drift
+from app.modules.athlete.repository import AthleteRepository
+from app.modules.athlete.schemas import AthleteFilter, AthleteOutput, AthleteUpdate
+from app.modules.category.repository import CategoryRepository
+from app.modules.training_center.models import TrainingCenterModel
+from app.modules.training_center.repository import TrainingCenterRepository
+from tests.factories import make_athlete
+
+pytestmark = pytest.mark.anyio
+
+
+class _CategoryRename(BaseModel):
+    name: str
+
+
+class _TrainingCenterUpdate(BaseModel):
+    name: str
+    owner: str
+
+
+async def _read_model_rows() -> int:
+    async with get_async_context_session() as db_session:
+        return (await db_session.execute(select(func.count()).select_from(AthleteReadModel))).scalar_one()
+
+
+async def test_projection_is_not_maintained_when_disabled(category_and_training_center, monkeypatch):
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_ENABLED", False)
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_SYNC_ENABLED", False)
+    category, training_center = category_and_training_center
+
+    async with get_async_context_session() as db_session:
+        await AthleteRepository().create(obj_in=make_athlete(category, training_center, 1), async_session=db_session)
+
+    assert await _read_model_rows() == 0
+
+
+@pytest.mark.parametrize("flag", ["ATHLETE_READ_MODEL_ENABLED", "ATHLETE_READ_MODEL_SYNC_ENABLED"])
+async def test_projection_follows_writes_when_maintained(category_and_training_center, monkeypatch, flag):
+    monkeypatch.setattr(settings, flag, True)
+    category, training_center = category_and_training_center
+
+    async with get_async_context_session() as db_session:
+        repository = AthleteRepository()
+        for index in range(3):
+            await repository.create(
+                obj_in=make_athlete(category, training_center, index), async_session=db_session
+            )
+        assert await find_read_model_drift(db_session) == []
+
+        await CategoryRepository().update(
+            id=category.pk_id, obj_in=_CategoryRename(name="RX"), async_session=db_session
+        )
+        names = (await db_session.execute(select(AthleteReadModel.category_name).distinct())).scalars().all()
+
+    assert await _read_model_rows() == 3
+    assert names == ["RX"]
+
+
+async def test_projection_follows_athlete_update_and_delete(category_and_training_center, monkeypatch):
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_SYNC_ENABLED", True)
+    category, training_center = category_and_training_center
+    repository = AthleteRepository()
+
+    async with get_async_context_session() as db_session:
+        kept, removed = [
+            await repository.create(obj_in=make_athlete(category, training_center, index), async_session=db_session)
+            for index in range(2)
+        ]
+        await repository.update(
+            id=kept.pk_id, obj_in=AthleteUpdate(name="Renomeado", age=41), async_session=db_session
+        )
+        await repository.remove(id=removed.pk_id, async_session=db_session)
+
+        assert await find_read_model_drift(db_session) == []
+        rows = (await db_session.execute(select(AthleteReadModel))).scalars().all()
+
+    assert [(row.athlete_pk_id, row.name, row.age) for row in rows] == [(kept.pk_id, "Renomeado", 41)]
+
+
+async def test_projection_follows_training_center_update(category_and_training_center, monkeypatch):
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_SYNC_ENABLED", True)
+    category, training_center = category_and_training_center
+
+    async with get_async_context_session() as db_session:
+        for index in range(2):
+            await AthleteRepository().create(
+                obj_in=make_athlete(category, training_center, index), async_session=db_session
+            )
+        await TrainingCenterRepository().update(
+            id=training_center.pk_id, obj_in=_TrainingCenterUpdate(name="CT Queen", owner="Maria"),
+            async_session=db_session,
+        )
+
+        assert await find_read_model_drift(db_session) == []
+        centers = (await db_session.execute(
+            select(AthleteReadModel.training_center_name, AthleteReadModel.training_center_owner).distinct()
+        )).all()
+
+    assert centers == [("CT Queen", "Maria")]
+
+
+async def test_read_model_pages_match_the_orm_listing(category_and_training_center, monkeypatch):
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_ENABLED", True)
+    category, training_center = category_and_training_center
+    async with get_async_context_session() as db_session:
+        other_center = TrainingCenterModel(name="CT Prime", address="Rua B, 1", owner="Ana")
+        db_session.add(other_center)
+        await db_session.commit()
+        repository = AthleteRepository()
+        for index in range(7):
+            await repository.create(
+                obj_in=make_athlete(category, (training_center, other_center)[index % 3 == 0], index),
+                async_session=db_session,
+            )
+
+    def as_json(page: Page) -> dict:
+        return Page[AthleteOutput].model_validate(page, from_attributes=True).model_dump(mode="json")
+
+    for filter_in in (AthleteFilter(), AthleteFilter(training_center_id=other_center.id), AthleteFilter(gender="M")):
+        for page in (1, 2, 3):
+            async with get_async_context_session() as db_session:
+                read_model_page = await repository.paginate_read_model(
+                    filter_in=filter_in, page=page, size=3, async_session=db_session
+                )
+                orm_page = await repository.paginate(
+                    filter_in=filter_in, sort_by={"pk_id": 1}, page=page, size=3, async_session=db_session
+                )
+                assert as_json(read_model_page) == as_json(orm_page)
+
+
+@pytest.mark.postgres
+async def test_center_filter_uses_the_read_model_center_index(category_and_training_center, monkeypatch):
+    monkeypatch.setattr(settings, "ATHLETE_READ_MODEL_ENABLED", True)
+    _, training_center = category_and_training_center
+    executed: list[tuple[str, tuple]] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        async with get_async_context_session() as db_session:
+            await AthleteRepository().paginate_read_model(
+                filter_in=AthleteFilter(training_center_id=training_center.id), async_session=db_session
+            )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    statement, parameters = executed[-1]
+    async with get_async_engine().connect() as connection:
+        # Com a tabela vazia o planner preferiria a varredura sequencial
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = "\n".join((await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)).scalars())
+
+    assert "ix_athlete_read_model_training_center_pk_id" in plan
+    assert "Sort" not in plan
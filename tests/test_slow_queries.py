@@ -0,0 +1,128 @@
+import json
+import logging
+import uuid
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+
+from app.core.databases import get_async_context_session, get_async_engine
+from app.core.settings import settings
+from app.core.slow_queries import SlowQueryRecorder, SlowQueryRouteMiddleware
+from app.modules.category.repository import CategoryRepository
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def recorder(database, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_LOG_PATH", str(tmp_path / "slow_queries.jsonl"))
+    recorder = SlowQueryRecorder(threshold_ms=0, explain_sample_rate=0, explain_timeout_ms=1000, buffer_size=3)
+    recorder.install()
+    yield recorder
+    event.remove(Engine, "before_cursor_execute", recorder._before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", recorder._after_cursor_execute)
+    event.remove(Engine, "handle_error", recorder._handle_error)
+    for handler in list(recorder._file_logger.handlers):
+        recorder._file_logger.removeHandler(handler)
+        handler.close()
+    if recorder._explain_task is not None:
+        await recorder._explain_task
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/categories/{count}")
+    async def get_categories(count: int):
+        async with get_async_context_session() as db_session:
+            await CategoryRepository().get_many([uuid.uuid4() for _ in range(count)], async_session=db_session)
+        return {}
+
+    app.add_middleware(SlowQueryRouteMiddleware)
+    return app
+
+
+async def test_record_keeps_normalized_sql_parameter_types_origin_and_route(recorder):
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/categories/3")).status_code == 200
+
+    record = recorder.records[-1]
+    assert record["origin"] == "CategoryRepository.get_many"
+    assert record["route"]["method"] == "GET"
+    assert record["route"]["path"] == "/categories/3"
+    assert record["route"]["endpoint"].endswith("get_categories")
+    assert "\n" not in record["sql"] and "  " not in record["sql"]
+    if get_async_engine().dialect.name == "postgresql":
+        assert "= ANY (" in record["sql"]
+        assert record["parameters"] == ["list"]
+    else:
+        # A lista de placeholders do IN vira um único marcador, qualquer que seja o tamanho
+        assert "IN (...)" in record["sql"]
+        assert record["parameters"] == ["str", "str", "str"]
+    # Só os tipos: os valores (que podem ser dados pessoais) não são guardados
+    assert all(isinstance(parameter, str) and len(parameter) < 10 for parameter in record["parameters"])
+
+
+async def test_records_are_bounded_and_written_as_jsonl(recorder):
+    async with get_async_context_session() as db_session:
+        for count in range(1, 6):
+            await CategoryRepository().get_many([uuid.uuid4() for _ in range(count)], async_session=db_session)
+
+    # O buffer guarda só os 3 mais recentes; o arquivo guarda todos
+    assert len(recorder.records) == 3
+    assert [record["origin"] for record in recorder.records] == ["CategoryRepository.get_many"] * 3
+    with open(settings.SLOW_QUERY_LOG_PATH, encoding="utf-8") as log_file:
+        lines = [json.loads(line) for line in log_file]
+    assert len(lines) >= 5
+    assert lines[-3:] == json.loads(json.dumps(list(recorder.records), default=str))
+
+
+async def test_fast_queries_are_not_recorded(recorder):
+    recorder.threshold = 60
+    async with get_async_context_session() as db_session:
+        await db_session.execute(select(func.count()).select_from(select(1).subquery()))
+
+    assert len(recorder.records) == 0
+
+
+@pytest.mark.postgres
+async def test_sampled_select_gets_its_plan_from_a_side_connection(recorder):
+    recorder.explain_sample_rate = 1
+    async with get_async_context_session() as db_session:
+        await CategoryRepository().get_many([uuid.uuid4()], async_session=db_session)
+    await recorder._explain_task
+
+    record = recorder.records[-1]
+    assert record["origin"] == "CategoryRepository.get_many"
+    (plan,) = record["plan"]
+    assert "Execution Time" in plan
+    assert plan["Plan"]["Relation Name"] == "categories"
+    assert "Shared Hit Blocks" in plan["Plan"]
+
+
+@pytest.mark.postgres
+async def test_one_explain_at_a_time_outside_the_pool_and_with_a_timeout(recorder, caplog):
+    recorder.explain_sample_rate = 1
+    recorder.explain_timeout_ms = 100
+    pool = get_async_engine().sync_engine.pool
+    async with get_async_context_session() as db_session:
+        await db_session.execute(select(func.pg_sleep(0.2)))
+        explain_task = recorder._explain_task
+        # Enquanto um EXPLAIN roda, as demais amostras ficam sem plano
+        await db_session.execute(select(func.pg_sleep(0.01)))
+        assert recorder._explain_task is explain_task
+        assert recorder.records[-1]["plan"] is None
+    # A conexão do EXPLAIN não sai do pool das requisições
+    assert pool.checkedout() == 0
+
+    with caplog.at_level(logging.WARNING, logger="app.core.slow_queries"):
+        await explain_task
+
+    # O EXPLAIN ANALYZE do pg_sleep(0.2) passa do statement_timeout da conexão à parte
+    record = recorder.records[-1]
+    assert record["sql"].startswith("SELECT pg_sleep(") and record["plan"] is None
+    assert "statement timeout" in caplog.text
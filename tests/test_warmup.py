@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+
+from app.core import warmup
+from app.core.databases import get_async_context_session, get_async_engine
+from app.modules.athlete.repository import AthleteRepository
+from app.modules.athlete.schemas import AthleteFilter
+from app.modules.category.repository import CategoryRepository
+from app.modules.category.schemas import CategoryFilter
+from app.modules.training_center.repository import TrainingCenterRepository
+from app.modules.training_center.schemas import TrainingCenterFilter
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_warm_up_runs_hot_statements(database):
+    await warmup.warm_up(FastAPI(), connections=2, timeout=10)
+
+    engine = get_async_engine()
+    assert engine.pool.checkedin() == 2
+    assert len(engine.sync_engine._compiled_cache) > 0
+
+    # As mesmas chamadas das rotas já encontram os statements compilados
+    cache_hits: list[bool] = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit == CACHE_HIT)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", collect)
+    try:
+        async with get_async_context_session() as db_session:
+            await AthleteRepository().find_one(filter_in=AthleteFilter(id=uuid.uuid4()), async_session=db_session)
+            await AthleteRepository().paginate(
+                filter_in=AthleteFilter(), sort_by={"pk_id": 1}, page=3, async_session=db_session
+            )
+            await CategoryRepository().find_one(
+                filter_in=CategoryFilter(id=[uuid.uuid4()]), async_session=db_session
+            )
+            await TrainingCenterRepository().find_one(
+                filter_in=TrainingCenterFilter(id=uuid.uuid4()), async_session=db_session
+            )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", collect)
+
+    assert cache_hits and all(cache_hits)
+
+
+async def test_unreachable_database_does_not_block_startup(monkeypatch, caplog):
+    async def refuse(connections: int) -> None:
+        raise ConnectionRefusedError("banco fora do ar")
+
+    monkeypatch.setattr(warmup, "_open_pool_connections", refuse)
+
+    with caplog.at_level(logging.WARNING, logger=warmup.__name__):
+        await warmup.warm_up(FastAPI(), connections=2, timeout=10)
+
+    assert "Aquecimento do banco falhou" in caplog.text
+
+
+async def test_slow_database_is_abandoned_after_timeout(monkeypatch):
+    async def hang(connections: int) -> None:
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(warmup, "_open_pool_connections", hang)
+
+    async with asyncio.timeout(5):
+        await warmup.warm_up(FastAPI(), connections=2, timeout=0.05)